@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import cached_property, lru_cache
 
 from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
@@ -8,9 +9,6 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
 )
-from homeassistant.helpers.event import (
-    async_track_utc_time_change
-)
 from homeassistant.util import dt as dt_util
 from .const import DOMAIN, OCTOPUS_SYSTEM
 from .entity import OctopusIntelligentPerDeviceEntityMixin
@@ -98,25 +96,18 @@ OFFPEAK_WINDOW_DEFINITIONS: tuple[SlotDefinition, ...] = (
 )
 
 
-def _is_slot_mode_active(
-    octopus_system,
-    slot_mode: str,
-    device_id: str | None,
-    minutes_offset: int,
-):
-    return octopus_system.is_slot_mode_active(
-        slot_mode,
-        device_id=device_id,
-        minutes_offset=minutes_offset,
-    )
-
-
 def _parse_dispatch_datetime(value):
     if isinstance(value, datetime):
         return value.astimezone(timezone.utc)
     if not isinstance(value, str):
         return None
+    return _parse_dispatch_datetime_str(value)
+
 
+# Slot sensors re-filter the same dispatch end times every half hour until the
+# next poll replaces them, so parsed strings are memoised.
+@lru_cache(maxsize=256)
+def _parse_dispatch_datetime_str(value: str):
     cleaned = value.replace("Z", "+00:00")
     try:
         parsed = datetime.fromisoformat(cleaned)
@@ -166,7 +157,6 @@ async def async_setup_entry(
         for definition in definitions:
             entities.append(
                 OctopusIntelligentSlot(
-                    hass,
                     octopus_system,
                     definition.unique_id_source,
                     definition.combined_name,
@@ -183,7 +173,6 @@ async def async_setup_entry(
 
     entities.append(
         OctopusIntelligentPlannedDispatchSlot(
-            hass,
             octopus_system,
             "Planned Dispatch Slot",
             "Planned Dispatch Slot",
@@ -197,7 +186,6 @@ async def async_setup_entry(
 
         entities.append(
             OctopusIntelligentPlannedDispatchSlot(
-                hass,
                 octopus_system,
                 "Planned Dispatch Slot",
                 "Planned Dispatch Slot",
@@ -210,6 +198,9 @@ async def async_setup_entry(
 
 
 class _OctopusBinaryEntityBase(OctopusIntelligentPerDeviceEntityMixin):
+    _refresh_on_half_hour = True
+
+    @cached_property
     def _account_device_info(self):
         return {
             "identifiers": {
@@ -221,10 +212,8 @@ class _OctopusBinaryEntityBase(OctopusIntelligentPerDeviceEntityMixin):
 
     def _slot_device_info(self):
         if self._is_combined:
-            return self._account_device_info()
-        info = self._device_info()
-        info["via_device"] = ("AccountID", self._octopus_system.account_id)
-        return info
+            return self._account_device_info
+        return self._device_info(via_account=True)
 
 
 class OctopusIntelligentSlot(
@@ -232,7 +221,6 @@ class OctopusIntelligentSlot(
 ):
     def __init__(
         self,
-        hass,
         octopus_system,
         unique_id_source: str,
         combined_name: str,
@@ -259,30 +247,19 @@ class OctopusIntelligentSlot(
         self._slot_mode = slot_mode
         self._store_attributes = store_attributes
         self._look_ahead_mins = look_ahead_mins
-        self._attributes = {}
+        # Only the combined 'now' slot sensor stores attributes; the rest have none.
+        self._attributes = None
         self._is_on = self._is_slot_active()
 
-        self._timer = async_track_utc_time_change(
-            hass, self.timer_update, minute=range(0, 60, 30), second=1)
-
     def _is_slot_active(self):
-        mins_looked = 0
-        while mins_looked <= self._look_ahead_mins:
-            if not self._is_active_at_offset(mins_looked):
-                return False
-            mins_looked += 30
-        return True
-
-    def _is_active_at_offset(self, minutes_offset: int) -> bool:
-        return _is_slot_mode_active(
-            self._octopus_system,
+        return self._octopus_system.is_slot_mode_active_ahead(
             self._slot_mode,
-            self._device_id,
-            minutes_offset,
+            device_id=self._device_id,
+            look_ahead_mins=self._look_ahead_mins,
         )
 
     @callback
-    def _handle_coordinator_update(self) -> None:
+    def _async_update_from_coordinator(self) -> None:
         """Handle updated data from the coordinator."""
         self._is_on = self._is_slot_active()
         if (self._store_attributes):
@@ -290,13 +267,13 @@ class OctopusIntelligentSlot(
                 self._attributes = self.coordinator.data
             else:
                 self._attributes = self._octopus_system.get_device_state(self._device_id) or {}
-        self.async_write_ha_state()
+        self._async_write_ha_state_if_changed(self._is_on, self._attributes)
 
     @callback
-    async def timer_update(self, time):
+    def timer_update(self, time) -> None:
         """Refresh state when timer is fired."""
         self._is_on = self._is_slot_active()
-        self.async_write_ha_state()
+        self._async_write_ha_state_if_changed(self._is_on, self._attributes)
 
     @property
     def name(self):
@@ -328,17 +305,12 @@ class OctopusIntelligentSlot(
         """Icon of the entity."""
         return "mdi:home-lightning-bolt-outline"
 
-    async def async_will_remove_from_hass(self):
-        """Unsubscribe when removed."""
-        self._timer()
-
 
 class OctopusIntelligentPlannedDispatchSlot(
     _OctopusBinaryEntityBase, CoordinatorEntity, BinarySensorEntity
 ):
     def __init__(
         self,
-        hass,
         octopus_system,
         combined_name: str,
         name_suffix: str,
@@ -362,21 +334,18 @@ class OctopusIntelligentPlannedDispatchSlot(
         self._attributes = {}
         self._is_on = False
         self._update_state()
-
-        self._timer = async_track_utc_time_change(
-            hass, self.timer_update, minute=range(0, 60, 30), second=1)
         
     @callback
-    def _handle_coordinator_update(self) -> None:
+    def _async_update_from_coordinator(self) -> None:
         """Handle updated data from the coordinator."""
         self._update_state()
-        self.async_write_ha_state()
+        self._async_write_ha_state_if_changed(self._is_on, self._attributes)
 
     @callback
-    async def timer_update(self, time):
+    def timer_update(self, time) -> None:
         """Refresh state when timer is fired."""
         self._update_state()
-        self.async_write_ha_state()
+        self._async_write_ha_state_if_changed(self._is_on, self._attributes)
 
     def _update_state(self):
         planned = self._get_planned_dispatches()
@@ -435,7 +404,3 @@ class OctopusIntelligentPlannedDispatchSlot(
     def icon(self):
         """Icon of the entity."""
         return "mdi:ev-station"
-
-    async def async_will_remove_from_hass(self):
-        """Unsubscribe when removed."""
-        self._timer()
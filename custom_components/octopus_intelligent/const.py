@@ -1,4 +1,3 @@
-from itertools import cycle, islice
 from typing import Final
 
 DOMAIN: Final = "octopus_intelligent"
@@ -56,10 +55,10 @@ UNSUPPORTED_DEVICE_KEYWORDS: Final = (
 	"REGISTRATION",
 )
 
-UNSUPPORTED_DEVICE_PROVIDERS: Final = (
+UNSUPPORTED_DEVICE_PROVIDERS: Final = frozenset({
 	"OCTOPUS_ENERGY",
-)
+})
 
-UNSUPPORTED_DEVICE_IDENTIFIERS: Final = (
+UNSUPPORTED_DEVICE_IDENTIFIERS: Final = frozenset({
 	"OCTOPUS_ENERGY",
-)
+})
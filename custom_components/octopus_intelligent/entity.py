@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import logging
+from functools import cached_property
 from typing import Any
 
+from homeassistant.core import callback
+
 from .const import DOMAIN
-from .util import format_equipment_name
+
+_LOGGER = logging.getLogger(__name__)
 
 
 class OctopusIntelligentPerDeviceEntityMixin:
@@ -12,19 +17,95 @@ class OctopusIntelligentPerDeviceEntityMixin:
     _octopus_system: Any
     _device_id: str | None
 
+    # Coordinator data is replaced, never mutated, on each poll, so the device's
+    # state is looked up once per data dict.
+    _equipment_state_source: Any = None
+    _equipment_state_cache: dict[str, Any] | None = None
+
+    # Device info only changes when a poll brings a new device dict, so it is
+    # cached against the identity of the dict it was built from.
+    _device_info_source: Any = None
+    _device_info_cache: dict[str, Any] | None = None
+    # (prefix, suffix, name) of the last name built; the label rarely changes.
+    _prefixed_name_cache: tuple[str, str, str] | None = None
+    # (values, available, name) of the last state written.
+    _last_written_state: tuple | None = None
+    # Entities whose state depends on the time of day set this to have
+    # timer_update called on every half hour.
+    _refresh_on_half_hour = False
+
     def _equipment_state(self) -> dict[str, Any] | None:
         if not getattr(self, "_device_id", None):
             return None
-        devices = (self._octopus_system.data or {}).get("devices") or {}
-        return devices.get(self._device_id)
+        data = self._octopus_system.data
+        if data is not self._equipment_state_source or data is None:
+            devices = data.get("devices") if data else None
+            self._equipment_state_cache = devices.get(self._device_id) if devices else None
+            self._equipment_state_source = data
+        return self._equipment_state_cache
 
-    def _equipment_label(self, *, fallback: str | None = None) -> str:
-        label_fallback = fallback or (
-            f"Equipment {self._device_id}" if self._device_id else "Equipment"
-        )
-        device_state = self._equipment_state() or {}
-        device = device_state.get("device")
-        return format_equipment_name(device, fallback=label_fallback)
+    def _equipment_label(self) -> str:
+        if not self._device_id:
+            return "Equipment"
+        # Shared by every entity of the device; formatted once per poll.
+        return self._octopus_system.get_equipment_label(self._device_id)
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        if self._refresh_on_half_hour:
+            self.async_on_remove(
+                self._octopus_system.async_add_half_hour_listener(self.timer_update)
+            )
+        # The platform writes the initial state once this returns.
+        self._async_refresh_on_add()
+
+    @callback
+    def _async_refresh_on_add(self) -> None:
+        """Bring the entity's state up to date before it is first written."""
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh from new coordinator data, logging rather than raising errors.
+
+        The coordinator calls its listeners in turn, so an exception here would
+        stop the remaining entities from seeing the new data.
+        """
+        try:
+            self._async_update_from_coordinator()
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error updating %s with new data", self.entity_id)
+
+    @callback
+    def _async_update_from_coordinator(self) -> None:
+        """Update the entity from new coordinator data; overridden by entities."""
+        self.async_write_ha_state()
+
+    def _async_write_ha_state_if_changed(self, *values: Any) -> None:
+        """Write state unless the values, availability and name match the last write.
+
+        Coordinator updates fire on every poll; most leave the entity unchanged.
+        """
+        state = (values, self.available, self.name)
+        if state == self._last_written_state:
+            return
+        self._last_written_state = state
+        self.async_write_ha_state()
+
+    @cached_property
+    def _device_identifiers(self) -> set[tuple[str, str]]:
+        identifier = f"{self._octopus_system.account_id}_{self._device_id}"
+        return {(DOMAIN, identifier)}
+
+    @cached_property
+    def _tariff_device_info(self) -> dict[str, Any]:
+        """Account-level device that combined entities attach to; it never changes."""
+        return {
+            "identifiers": {
+                ("AccountID", self._octopus_system.account_id),
+            },
+            "name": "Octopus Intelligent Tariff",
+            "manufacturer": "Octopus",
+        }
 
     def _name_prefix(self) -> str:
         if getattr(self, "_is_combined", False):
@@ -34,20 +115,38 @@ class OctopusIntelligentPerDeviceEntityMixin:
 
     def _prefixed_name(self, suffix: str) -> str:
         prefix = self._name_prefix()
+        cached = self._prefixed_name_cache
+        if cached is not None and cached[0] == prefix and cached[1] == suffix:
+            return cached[2]
+
         suffix_value = (suffix or "").strip()
         if not prefix:
-            return suffix_value
-        if not suffix_value:
-            return prefix
-        return f"{prefix} {suffix_value}"
+            name = suffix_value
+        elif not suffix_value:
+            name = prefix
+        else:
+            name = f"{prefix} {suffix_value}"
+        self._prefixed_name_cache = (prefix, suffix, name)
+        return name
+
+    def _device_info(self, *, via_account: bool = False) -> dict[str, Any]:
+        """Return the entity's device info, optionally linked to the tariff device.
 
-    def _device_info(self) -> dict[str, Any]:
+        An entity always passes the same via_account, so one cache suffices.
+        """
         device_state = self._equipment_state() or {}
-        device = device_state.get("device") or {}
-        manufacturer = device.get("provider") or "Octopus"
-        identifier = f"{self._octopus_system.account_id}_{self._device_id}"
-        return {
-            "identifiers": {(DOMAIN, identifier)},
+        device = device_state.get("device")
+        if self._device_info_cache is not None and device is self._device_info_source:
+            return self._device_info_cache
+
+        manufacturer = (device or {}).get("provider") or "Octopus"
+        info = {
+            "identifiers": self._device_identifiers,
             "name": self._equipment_label(),
             "manufacturer": manufacturer,
         }
+        if via_account:
+            info["via_device"] = ("AccountID", self._octopus_system.account_id)
+        self._device_info_source = device
+        self._device_info_cache = info
+        return info
@@ -1,13 +1,32 @@
+import asyncio
 import logging
-import math
 from typing import Callable, Optional
 
 from gql import Client, gql
 from gql.transport.aiohttp import AIOHTTPTransport
+from gql.transport.exceptions import TransportQueryError
 from graphql import GraphQLInputObjectType, GraphQLNonNull, GraphQLObjectType, get_named_type
 
+from .util import round_charge_preferences
+
 _LOGGER = logging.getLogger(__name__)
 
+# Signs that the API refused the combined device query itself, as opposed to a
+# transient failure such as an expired token or a rate limit.
+_QUERY_REJECTION_MARKERS = ("complexity", "cannot query field")
+
+
+def _is_query_rejection(ex: TransportQueryError) -> bool:
+  for error in ex.errors or [{"message": str(ex)}]:
+    if not isinstance(error, dict):
+      continue
+    if (error.get("extensions") or {}).get("errorType") == "VALIDATION":
+      return True
+    message = str(error.get("message", "")).lower()
+    if any(marker in message for marker in _QUERY_REJECTION_MARKERS):
+      return True
+  return False
+
 GET_DEVICES_QUERY = gql(
     """
     query getDevices($accountNumber: String!) {
@@ -95,6 +114,55 @@ GET_DEVICE_DISPATCHES_QUERY = gql(
     """
 )
 
+GET_DEVICE_DETAILS_QUERY = gql(
+    """
+    query getDeviceDetails($accountNumber: String!, $deviceId: String!) {
+      devices(accountNumber: $accountNumber, deviceId: $deviceId) {
+        id
+        status {
+          isSuspended
+          currentState
+        }
+        ... on SmartFlexVehicle {
+          chargingPreferences {
+            weekdayTargetTime
+            weekdayTargetSoc
+            weekendTargetTime
+            weekendTargetSoc
+            minimumSoc
+            maximumSoc
+          }
+        }
+        ... on SmartFlexChargePoint {
+          chargingPreferences {
+            weekdayTargetTime
+            weekdayTargetSoc
+            weekendTargetTime
+            weekendTargetSoc
+            minimumSoc
+            maximumSoc
+          }
+        }
+      }
+      flexPlannedDispatches(deviceId: $deviceId) {
+        start
+        end
+        type
+        energyAddedKwh
+      }
+      completedDispatches(accountNumber: $accountNumber) {
+        start
+        end
+        delta
+        meta {
+          source
+          location
+        }
+      }
+    }
+    """
+)
+
 
 class OctopusEnergyGraphQLClient:
 
@@ -105,6 +173,9 @@ class OctopusEnergyGraphQLClient:
     self._api_key = api_key
     self._base_url = "https://api.octopus.energy/v1/graphql/"
     self._session: Optional[Client] = None
+    # Cleared only if the API rejects the combined device query as invalid or
+    # too complex; transient errors leave it on for the next poll.
+    self._combined_device_query = True
 
   async def async_get_accounts(self) -> list[str]:
     return await self.__async_execute_with_session(self.__async_get_accounts)
@@ -124,6 +195,18 @@ class OctopusEnergyGraphQLClient:
       lambda session: self.__async_get_device_dispatches(session, account_id, device_id)
     )
 
+  async def async_get_device_details(self, account_id: str, device_ids: list[str]):
+    """Fetch preferences and dispatches for several devices over one session.
+
+    Each device is read with one combined query (falling back to separate
+    preference and dispatch queries if the API rejects it), and the queries
+    run concurrently; a shared gql Client cannot be entered by overlapping
+    calls, so this is the safe way to parallelise per-device reads.
+    """
+    return await self.__async_execute_with_session(
+      lambda session: self.__async_get_device_details(session, account_id, device_ids)
+    )
+
   async def async_get_charge_preferences(self, account_id: str):
     return await self.__async_execute_with_session(
       lambda session: self.__async_get_charge_preferences(session, account_id)
@@ -211,8 +294,9 @@ class OctopusEnergyGraphQLClient:
     targetSocPercent: int,
     device_id: Optional[str],
   ):
-    targetSocPercent = 5 * math.ceil(round(targetSocPercent) / 5)
-    readyByHoursAfterMidnight = 0.5 * round(readyByHoursAfterMidnight / 0.5)
+    readyByHoursAfterMidnight, targetSocPercent = round_charge_preferences(
+      readyByHoursAfterMidnight, targetSocPercent
+    )
 
     if readyByHoursAfterMidnight < 4 or readyByHoursAfterMidnight > 11:
         raise ValueError("Target time must be between 4AM and 11AM")
@@ -558,6 +642,53 @@ class OctopusEnergyGraphQLClient:
       operation_name="getDeviceDispatches",
     )
 
+  async def __async_get_device_details(self, session, account_id: str, device_ids: list[str]):
+    if self._combined_device_query:
+      # Let every bundle finish before deciding, so no sibling query is still
+      # using the session when the fallback starts.
+      results = await asyncio.gather(
+        *(
+          self.__async_get_device_bundle(session, account_id, device_id)
+          for device_id in device_ids
+        ),
+        return_exceptions=True,
+      )
+      failures = [result for result in results if isinstance(result, BaseException)]
+      if not failures:
+        return dict(zip(device_ids, results))
+      rejection = next(
+        (
+          failure
+          for failure in failures
+          if isinstance(failure, TransportQueryError) and _is_query_rejection(failure)
+        ),
+        None,
+      )
+      if rejection is None:
+        raise failures[0]
+      _LOGGER.debug("Combined device query rejected, using separate queries: %s", rejection)
+      self._combined_device_query = False
+
+    results = await asyncio.gather(*(
+      query(session, account_id, device_id)
+      for device_id in device_ids
+      for query in (self.__async_get_device_preferences, self.__async_get_device_dispatches)
+    ))
+    return {
+      device_id: (results[2 * index], results[2 * index + 1])
+      for index, device_id in enumerate(device_ids)
+    }
+
+  async def __async_get_device_bundle(self, session, account_id: str, device_id: str):
+    params = {"accountNumber": account_id, "deviceId": device_id}
+    result = await session.execute(
+      GET_DEVICE_DETAILS_QUERY,
+      variable_values=params,
+      operation_name="getDeviceDetails",
+    )
+    devices = result.get('devices', []) if isinstance(result, dict) else []
+    return (devices[0] if devices else None), result
+
   async def __async_get_device_info(self, session, account_id: str):
     query = gql(
       '''
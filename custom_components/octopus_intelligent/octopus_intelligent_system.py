@@ -1,13 +1,19 @@
 """Support for Octopus Intelligent Tariff in the UK."""
 from dataclasses import dataclass
+from bisect import bisect_left, bisect_right
 from collections import Counter
-from datetime import timedelta, datetime, timezone
+from functools import cached_property
+from operator import itemgetter
+from datetime import date, timedelta, datetime, time, timezone
 from typing import Any
 import asyncio
 import logging
 
 import homeassistant.util.dt as dt_util
 
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_track_utc_time_change
+from homeassistant.util import slugify
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
@@ -20,9 +26,11 @@ from .util import *
 from .const import CONF_POLL_INTERVAL_DEFAULT
 
 _LOGGER = logging.getLogger(__name__)
+_UTC = timezone.utc
+_MIN_UTC = datetime.min.replace(tzinfo=_UTC)
 
 
-@dataclass
+@dataclass(frozen=True)
 class DeviceTargetSchedule:
     device_id: str
     label: str
@@ -34,19 +42,6 @@ class DeviceTargetSchedule:
     minimum_soc: int | None
     maximum_soc: int | None
 
-    def as_dict(self) -> dict[str, Any]:
-        return {
-            "device_id": self.device_id,
-            "label": self.label,
-            "weekday_target_time": self.weekday_target_time,
-            "weekend_target_time": self.weekend_target_time,
-            "active_target_time": self.active_target_time,
-            "weekday_target_soc": self.weekday_target_soc,
-            "weekend_target_soc": self.weekend_target_soc,
-            "minimum_soc": self.minimum_soc,
-            "maximum_soc": self.maximum_soc,
-        }
-
     def as_device_attributes(self, mode: str) -> dict[str, Any]:
         return {
             "mode": mode,
@@ -62,27 +57,18 @@ class DeviceTargetSchedule:
         return bool(self.active_target_time)
 
 
-@dataclass
+@dataclass(frozen=True)
 class TargetReadySummary:
     mode: str
     active_target_key: str
     active_target_time: str | None
     target_device_id: str | None
     target_device_label: str | None
-    device_targets: list[DeviceTargetSchedule]
-
-    def device_count(self) -> int:
-        return len(self.device_targets)
+    device_targets: tuple[DeviceTargetSchedule, ...]
 
-    def as_combined_attributes(self) -> dict[str, Any]:
-        return {
-            "mode": self.mode,
-            "active_target_key": self.active_target_key,
-            "device_targets": [target.as_dict() for target in self.device_targets],
-            "target_device_id": self.target_device_id,
-            "target_device_label": self.target_device_label,
-            "device_count": self.device_count(),
-        }
+    @cached_property
+    def is_weekend(self) -> bool:
+        return self.mode == "weekend"
 
     def first_target(self) -> DeviceTargetSchedule | None:
         return self.device_targets[0] if self.device_targets else None
@@ -114,16 +100,76 @@ class OctopusIntelligentSystem(DataUpdateCoordinator):
 
         self._off_peak_start = off_peak_start
         self._off_peak_end = off_peak_end
+        self._off_peak_start_min = off_peak_start.seconds // 60
+        self._off_peak_end_min = off_peak_end.seconds // 60
+        self._off_peak_wraps = self._off_peak_end_min < self._off_peak_start_min
         self._primary_equipment_id = primary_equipment_id
         
         self.client = OctopusEnergyGraphQLClient(self._api_key)
         self._persistent_data = PersistentData()
         self._store = PersistentDataStore(self._persistent_data, hass, account_id)
 
+        # Bumped on every successful poll so per-poll caches invalidate themselves.
+        self._data_version = 0
+        self._summary_cache: dict[tuple[int, str | None, str], TargetReadySummary] = {}
+        self._device_ids: tuple[str, ...] = ()
+        self._equipment_labels: dict[str, str] = {}
+        # Slugs never change for an id, so they outlive polls.
+        self._device_slugs: dict[str, str] = {}
+        # Filled lazily by the first consumer after each poll.
+        self._smart_charge_windows: dict[str, list[tuple[datetime, datetime]]] = {}
+        self._parsed_dispatch_times: dict[str, datetime | None] = {}
+        self._offpeak_ranges: dict[
+            tuple[str | None, Any, date, int], tuple[list[dict[str, datetime]], list[datetime]]
+        ] = {}
+        # (utc epoch minute, time zone, result) of the last off-peak time check.
+        self._off_peak_time_cache: tuple[int, Any, bool] | None = None
+        self._dispatch_index: dict[
+            tuple[str | None, str | None], tuple[list[datetime], list[datetime]]
+        ] = {}
+        # Entities refreshed on the half hour share one timer, running while
+        # anyone listens.
+        self._half_hour_listeners: dict[CALLBACK_TYPE, None] = {}
+        self._unsub_half_hour_timer: CALLBACK_TYPE | None = None
+        # (slot mode, device id) -> (utc epoch second, results at offsets 0, 30, ...).
+        self._slot_mode_runs: dict[
+            tuple[str, str | None], tuple[int, list[bool]]
+        ] = {}
+
     @property
     def account_id(self):
         return self._account_id
 
+    @callback
+    def async_add_half_hour_listener(self, update_callback) -> CALLBACK_TYPE:
+        """Call update_callback one second past every half hour until unsubscribed."""
+        if not self._half_hour_listeners:
+            self._unsub_half_hour_timer = async_track_utc_time_change(
+                self.hass,
+                self._async_half_hour_tick,
+                minute=range(0, 60, 30),
+                second=1,
+            )
+        self._half_hour_listeners[update_callback] = None
+
+        @callback
+        def remove_listener() -> None:
+            self._half_hour_listeners.pop(update_callback, None)
+            if not self._half_hour_listeners and self._unsub_half_hour_timer:
+                self._unsub_half_hour_timer()
+                self._unsub_half_hour_timer = None
+
+        return remove_listener
+
+    @callback
+    def _async_half_hour_tick(self, now: datetime) -> None:
+        for update_callback in list(self._half_hour_listeners):
+            # One failing entity must not stop the rest from refreshing.
+            try:
+                update_callback(now)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error refreshing %s on the half hour", update_callback)
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from API endpoint.
 
@@ -134,23 +180,23 @@ class OctopusIntelligentSystem(DataUpdateCoordinator):
             dict: The data received from the Octopus API, for example:
             {
                 'completedDispatches': [{
-                    'chargeKwh': '-0.58',
+                    'chargeKwh': -0.58,
                     'startDtUtc': '2024-02-25 02:00:00+00:00',
                     'endDtUtc': '2024-02-25 02:30:00+00:00',
                     'meta': {'location': 'AT_HOME', 'source': None},
                 }, {
-                    'chargeKwh': '-0.58',
+                    'chargeKwh': -0.58,
                     'startDtUtc': '2024-02-25 03:30:00+00:00',
                     'endDtUtc': '2024-02-25 04:00:00+00:00',
                     'meta': {'location': 'AT_HOME', 'source': None},
                 }],
                 'plannedDispatches': [{
-                    'chargeKwh': '-0.67',
+                    'chargeKwh': -0.67,
                     'startDtUtc': '2024-02-25 23:30:00+00:00',
                     'endDtUtc': '2024-02-26 00:00:00+00:00',
                     'meta': {'location': None, 'source': 'smart-charge'},
                 }, {
-                    'chargeKwh': '-1.12',
+                    'chargeKwh': -1.12,
                     'startDtUtc': '2024-02-26 03:00:00+00:00',
                     'endDtUtc': '2024-02-26 04:00:00+00:00',
                     'meta': {'location': None, 'source': 'smart-charge'},
@@ -179,17 +225,14 @@ class OctopusIntelligentSystem(DataUpdateCoordinator):
                 union_planned: list[dict[str, Any]] = []
                 union_completed: list[dict[str, Any]] = []
 
-                for device in devices:
-                    device_id = device.get("id")
-                    if not device_id:
-                        continue
+                devices = [device for device in devices if device.get("id")]
+                device_details = await self.client.async_get_device_details(
+                    self._account_id, [device["id"] for device in devices]
+                )
 
-                    preferences = await self.client.async_get_device_preferences(
-                        self._account_id, device_id
-                    )
-                    dispatches = await self.client.async_get_device_dispatches(
-                        self._account_id, device_id
-                    )
+                for device in devices:
+                    device_id = device["id"]
+                    preferences, dispatches = device_details[device_id]
                     preferences = preferences or {}
                     dispatches = dispatches or {}
 
@@ -206,16 +249,14 @@ class OctopusIntelligentSystem(DataUpdateCoordinator):
 
                     device_states[device_id] = {
                         "device": device,
-                        "preferences": (preferences or {}).get(
-                            "chargingPreferences", {}
-                        ),
+                        "preferences": preferences.get("chargingPreferences", {}),
                         "plannedDispatches": planned,
                         "completedDispatches": completed,
                         "status": status,
                     }
 
-                union_planned.sort(key=lambda item: item.get("startDtUtc", ""))
-                union_completed.sort(key=lambda item: item.get("startDtUtc", ""))
+                self._sort_by_start(union_planned)
+                self._sort_by_start(union_completed)
 
                 primary_equipment_id = self._resolve_primary_equipment(device_states)
                 vehicle_preferences = (
@@ -224,6 +265,7 @@ class OctopusIntelligentSystem(DataUpdateCoordinator):
                     else {}
                 )
 
+                self._reset_poll_caches(device_states)
                 return {
                     "devices": device_states,
                     "plannedDispatches": union_planned,
@@ -234,6 +276,18 @@ class OctopusIntelligentSystem(DataUpdateCoordinator):
         except Exception as err:
             raise UpdateFailed(f"Error communicating with Octopus GraphQL API: {err}") from err
 
+    def _reset_poll_caches(self, device_states: dict[str, Any]) -> None:
+        """Drop everything derived from the previous coordinator data."""
+        self._data_version += 1
+        self._summary_cache.clear()
+        self._device_ids = tuple(device_states)
+        self._smart_charge_windows.clear()
+        self._parsed_dispatch_times.clear()
+        self._dispatch_index.clear()
+        self._offpeak_ranges.clear()
+        self._slot_mode_runs.clear()
+        self._equipment_labels.clear()
+
     def _update_planned_dispatch_sources(
         self, device_id: str, dispatches: list[dict[str, Any]]
     ) -> None:
@@ -241,9 +295,14 @@ class OctopusIntelligentSystem(DataUpdateCoordinator):
         if not dispatches:
             return
 
-        all_sources = [disp.get("meta", {}).get("source", "") for disp in dispatches]
-        has_missing = any(not src for src in all_sources)
-        source_counts = Counter(src for src in all_sources if src)
+        has_missing = False
+        source_counts: Counter[str] = Counter()
+        for disp in dispatches:
+            src = disp.get("meta", {}).get("source")
+            if src:
+                source_counts[src] += 1
+            else:
+                has_missing = True
         selected_source = ""
         fallback_source = ""
 
@@ -303,56 +362,114 @@ class OctopusIntelligentSystem(DataUpdateCoordinator):
     def _normalise_planned_dispatches(
         self, device_id: str, dispatches: list[dict[str, Any]]
     ) -> list[dict[str, Any]]:
-        normalised: list[dict[str, Any]] = []
-        for dispatch in dispatches or []:
-            meta_source = self._translate_dispatch_source(
-                dispatch.get("type") or dispatch.get("meta", {}).get("source")
-            )
-            entry = {
-                "chargeKwh": self._format_energy(dispatch.get("energyAddedKwh")),
-                "startDtUtc": self._format_dispatch_time(dispatch.get("start")),
-                "endDtUtc": self._format_dispatch_time(dispatch.get("end")),
+        format_energy = self._format_energy
+        format_time = self._format_dispatch_time
+        translate_source = self._translate_dispatch_source
+        normalised: list[dict[str, Any]] = [
+            {
+                "chargeKwh": format_energy(dispatch.get("energyAddedKwh")),
+                "startDtUtc": format_time(dispatch.get("start")),
+                "endDtUtc": format_time(dispatch.get("end")),
                 "meta": {
-                    "source": meta_source,
-                    "location": dispatch.get("meta", {}).get("location"),
+                    "source": translate_source(dispatch.get("type") or meta.get("source")),
+                    "location": meta.get("location"),
                     "deviceId": device_id,
                 },
             }
-            normalised.append(entry)
+            for dispatch in dispatches or []
+            for meta in [dispatch.get("meta") or {}]
+        ]
 
         self._update_planned_dispatch_sources(device_id, normalised)
         return normalised
 
+    @classmethod
+    def _sort_by_start(cls, dispatches: list[dict[str, Any]]) -> None:
+        """Sort normalised dispatches chronologically in place.
+
+        Dispatches without a start time sort last.
+        """
+        # The strings only sort chronologically while they share one UTC
+        # offset, which is what the API sends; mixed offsets fall back to
+        # comparing parsed datetimes.
+        start_key = itemgetter("startDtUtc")
+        offsets = {
+            start[-5:]
+            for start in map(start_key, dispatches)
+            if start is not None
+        }
+        if len(offsets) <= 1:
+            dispatches.sort(key=cls._start_string_key)
+        else:
+            dispatches.sort(key=cls._parsed_start_key)
+
+    @staticmethod
+    def _start_string_key(dispatch: dict[str, Any]) -> tuple[bool, str]:
+        start = dispatch["startDtUtc"]
+        return (start is None, start or "")
+
+    @classmethod
+    def _parsed_start_key(cls, dispatch: dict[str, Any]) -> tuple[bool, datetime]:
+        start = cls._parse_dispatch_datetime(dispatch["startDtUtc"])
+        return (start is None, start or _MIN_UTC)
+
+    def _get_smart_charge_windows(
+        self, device_id: str
+    ) -> list[tuple[datetime, datetime]]:
+        """Return a device's smart-charge dispatches as sorted (start, end) pairs.
+
+        Built on first use after each poll, so polls nobody reads pay no parsing.
+        """
+        windows = self._smart_charge_windows.get(device_id)
+        if windows is not None:
+            return windows
+
+        windows = []
+        device_state = self._get_device_state(device_id) or {}
+        for dispatch in device_state.get("plannedDispatches", []):
+            if dispatch.get("meta", {}).get("source") != "smart-charge":
+                continue
+            start_utc = self._get_parsed_dispatch_time(dispatch.get("startDtUtc"))
+            end_utc = self._get_parsed_dispatch_time(dispatch.get("endDtUtc"))
+            if start_utc and end_utc and start_utc <= end_utc:
+                windows.append((start_utc, end_utc))
+        windows.sort()
+        self._smart_charge_windows[device_id] = windows
+        return windows
+
     def _normalise_completed_dispatches(
         self, device_id: str, dispatches: list[dict[str, Any]]
     ) -> list[dict[str, Any]]:
-        normalised: list[dict[str, Any]] = []
-        for dispatch in dispatches or []:
-            entry = {
-                "chargeKwh": self._format_energy(dispatch.get("delta")),
-                "startDtUtc": self._format_dispatch_time(dispatch.get("start")),
-                "endDtUtc": self._format_dispatch_time(dispatch.get("end")),
+        format_energy = self._format_energy
+        format_time = self._format_dispatch_time
+        return [
+            {
+                "chargeKwh": format_energy(dispatch.get("delta")),
+                "startDtUtc": format_time(dispatch.get("start")),
+                "endDtUtc": format_time(dispatch.get("end")),
                 "meta": {
                     **(dispatch.get("meta") or {}),
                     "deviceId": device_id,
                 },
             }
-            normalised.append(entry)
-
-        return normalised
+            for dispatch in dispatches or []
+        ]
 
     def _build_device_status(self, device, preferences, dispatches):
-        status = dict((device or {}).get("status") or {})
+        base_status = (device or {}).get("status") or {}
         pref_status = (preferences or {}).get("status") or {}
         dispatch_devices = (dispatches or {}).get("devices") or []
         dispatch_status = (dispatch_devices[0] or {}).get("status") if dispatch_devices else {}
 
+        overrides: dict[str, Any] = {}
         if isinstance(pref_status, dict) and "isSuspended" in pref_status:
-            status["isSuspended"] = pref_status["isSuspended"]
+            overrides["isSuspended"] = pref_status["isSuspended"]
         if isinstance(dispatch_status, dict) and dispatch_status.get("currentState"):
-            status["currentState"] = dispatch_status["currentState"]
+            overrides["currentState"] = dispatch_status["currentState"]
 
-        return status
+        # Consumers only read the status, so share the device's dict when
+        # nothing needs overriding instead of copying it every poll.
+        return {**base_status, **overrides} if overrides else base_status
 
     def _resolve_primary_equipment(self, devices: dict[str, Any]) -> str | None:
         if self._primary_equipment_id and self._primary_equipment_id in devices:
@@ -363,18 +480,35 @@ class OctopusIntelligentSystem(DataUpdateCoordinator):
         return self._primary_equipment_id
 
     def _get_device_state(self, device_id: str | None = None):
-        devices = (self.data or {}).get("devices", {})
+        devices = self.data.get("devices") if self.data else None
+        if not devices:
+            return None
         lookup_id = device_id or self.get_primary_equipment_id()
-        if lookup_id and lookup_id in devices:
-            return devices[lookup_id]
-        return None
+        return devices.get(lookup_id) if lookup_id else None
 
     def get_device_state(self, device_id: str | None = None):
         return self._get_device_state(device_id)
 
-    def get_supported_device_ids(self) -> list[str]:
-        devices = (self.data or {}).get("devices") or {}
-        return list(devices.keys())
+    def get_supported_device_ids(self) -> tuple[str, ...]:
+        return self._device_ids
+
+    def get_equipment_label(self, device_id: str) -> str:
+        """Return the device's display label, formatted once per poll."""
+        label = self._equipment_labels.get(device_id)
+        if label is None:
+            state = self.get_device_state(device_id) or {}
+            label = self._equipment_labels[device_id] = format_equipment_name(
+                state.get('device'),
+                fallback=f"Equipment {device_id}",
+            )
+        return label
+
+    def device_slug(self, device_id: str) -> str:
+        """Return slugify(device_id), computed once per id for all its entities."""
+        slug = self._device_slugs.get(device_id)
+        if slug is None:
+            slug = self._device_slugs[device_id] = slugify(device_id)
+        return slug
 
     def get_primary_equipment_id(self) -> str | None:
         data_primary = (self.data or {}).get("primary_equipment_id") if self.data else None
@@ -388,6 +522,12 @@ class OctopusIntelligentSystem(DataUpdateCoordinator):
         if not value:
             return None
         if isinstance(value, str):
+            # Octopus normally sends "YYYY-MM-DDTHH:MM:SS+HH:MM" (or a "Z" suffix);
+            # rewrite those by slicing instead of a full parse/format round-trip.
+            if len(value) == 25 and value[10] == "T" and value[19] in "+-" and value[22] == ":":
+                return f"{value[:10]} {value[11:22]}{value[23:]}"
+            if len(value) == 20 and value[10] == "T" and value[19] == "Z":
+                return f"{value[:10]} {value[11:19]}+0000"
             try:
                 cleaned = value.replace("Z", "+00:00")
                 dt_value = datetime.fromisoformat(cleaned)
@@ -397,10 +537,13 @@ class OctopusIntelligentSystem(DataUpdateCoordinator):
         return None
 
     @staticmethod
-    def _format_energy(value: Any) -> Any:
+    def _format_energy(value: Any) -> float | None:
         if value is None:
             return None
-        return f"{value}"
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
 
     @staticmethod
     def _translate_dispatch_source(value: Any) -> str | None:
@@ -472,15 +615,60 @@ class OctopusIntelligentSystem(DataUpdateCoordinator):
         device_id: str | None = None,
     ):
         utcnow = dt_util.utcnow() + timedelta(minutes=minutes_offset)
-        localdate = dt_util.start_of_local_day(dt_util.as_local(utcnow))
-        fixed_start_b1 = dt_util.as_utc(localdate - timedelta(days=1) + self._off_peak_start)
-        fixed_end_b1 = dt_util.as_utc(localdate - timedelta(days=1) + self._off_peak_end)
-        fixed_start_0 = dt_util.as_utc(localdate + self._off_peak_start)
-        fixed_end_0 = dt_util.as_utc(localdate + self._off_peak_end)
-        fixed_start_a1 = dt_util.as_utc(localdate + timedelta(days=1) + self._off_peak_start)
-        fixed_end_a1 = dt_util.as_utc(localdate + timedelta(days=1) + self._off_peak_end)
-        #fixed_start_a2 = dt_util.as_utc(localdate + timedelta(days=2) + self._off_peak_start)
-        fixed_end_a2 = dt_util.as_utc(localdate + timedelta(days=2) + self._off_peak_end)
+        # Read the zone on each call (it can be changed at runtime) but convert
+        # with plain astimezone() rather than the dt_util as_local/as_utc wrappers.
+        local_tz = dt_util.DEFAULT_TIME_ZONE
+        localdate = datetime.combine(
+            utcnow.astimezone(local_tz).date(), time(), tzinfo=local_tz
+        )
+
+        # The merged ranges only change with the poll, the time zone, the local
+        # date and, for a device, which of its windows have ended. Ended windows form a
+        # growing set as time moves on, so their count identifies it.
+        stale_windows = 0
+        if device_id:
+            stale_windows = sum(
+                1
+                for _, end_utc in self._get_smart_charge_windows(device_id)
+                if end_utc < utcnow
+            )
+        cache_key = (device_id, local_tz, localdate.date(), stale_windows)
+        cached = self._offpeak_ranges.get(cache_key)
+        if cached is None:
+            offpeak_ranges = self._build_offpeak_ranges(localdate, utcnow, device_id)
+            cached = (offpeak_ranges, [offpeak_range["end"] for offpeak_range in offpeak_ranges])
+            self._offpeak_ranges[cache_key] = cached
+
+        # Merged ranges are disjoint and sorted, so the first one ending at or
+        # after now is either the current range or the next one.
+        offpeak_ranges, ends = cached
+        index = bisect_left(ends, utcnow)
+        if index < len(offpeak_ranges):
+            return dict(offpeak_ranges[index])
+        return None
+
+    def _build_offpeak_ranges(
+        self,
+        localdate: datetime,
+        utcnow: datetime,
+        device_id: str | None,
+    ) -> list[dict[str, datetime]]:
+        one_day = timedelta(days=1)
+        if (localdate - one_day).utcoffset() == (localdate + 3 * one_day).utcoffset():
+            # No DST change between yesterday and the last boundary, so a single
+            # conversion of midnight is enough and the rest is plain arithmetic.
+            midnight = localdate.astimezone(_UTC)
+        else:
+            # Convert each boundary so wall-clock times keep their own offset.
+            midnight = localdate
+        fixed_start_b1 = (midnight - one_day + self._off_peak_start).astimezone(_UTC)
+        fixed_end_b1 = (midnight - one_day + self._off_peak_end).astimezone(_UTC)
+        fixed_start_0 = (midnight + self._off_peak_start).astimezone(_UTC)
+        fixed_end_0 = (midnight + self._off_peak_end).astimezone(_UTC)
+        fixed_start_a1 = (midnight + one_day + self._off_peak_start).astimezone(_UTC)
+        fixed_end_a1 = (midnight + one_day + self._off_peak_end).astimezone(_UTC)
+        #fixed_start_a2 = (midnight + 2 * one_day + self._off_peak_start).astimezone(_UTC)
+        fixed_end_a2 = (midnight + 2 * one_day + self._off_peak_end).astimezone(_UTC)
 
         if fixed_start_b1 > fixed_end_b1:
             base_offpeak_ranges = [
@@ -495,80 +683,46 @@ class OctopusIntelligentSystem(DataUpdateCoordinator):
                 {"start": fixed_start_a1, "end": fixed_end_a1},
             ]
 
-        targeted_dispatches: list[dict[str, Any]] = []
-        combined_dispatches: list[dict[str, Any]] = []
-        supported_devices = set(self.get_supported_device_ids())
-
-        for state in (self.data or {}).get('plannedDispatches', []):
-            if state.get('meta', {}).get('source', '') != 'smart-charge':
-                continue
-
-            startUtc = self._parse_dispatch_datetime(state.get('startDtUtc'))
-            endUtc = self._parse_dispatch_datetime(state.get('endDtUtc'))
-            if not startUtc or not endUtc:
-                continue
-
-            entry = {"start": startUtc, "end": endUtc}
-            meta_device = state.get('meta', {}).get('deviceId')
-
-            if device_id:
-                if meta_device == device_id:
-                    targeted_dispatches.append(entry)
-            else:
-                if (
-                    meta_device
-                    and meta_device in supported_devices
-                    and not self.is_smart_charging_enabled(meta_device)
-                ):
-                    continue
-                combined_dispatches.append(entry)
-
         if device_id:
             # Drop stale dispatches so per-device sensors fall back to the base window
             targeted_dispatches = [
-                entry for entry in targeted_dispatches if entry["end"] >= utcnow
+                {"start": start_utc, "end": end_utc}
+                for start_utc, end_utc in self._get_smart_charge_windows(device_id)
+                if end_utc >= utcnow
             ]
             candidate_ranges = targeted_dispatches or base_offpeak_ranges
         else:
+            combined_dispatches = [
+                {"start": start_utc, "end": end_utc}
+                for window_device_id in self.get_supported_device_ids()
+                if self.is_smart_charging_enabled(window_device_id)
+                for start_utc, end_utc in self._get_smart_charge_windows(window_device_id)
+            ]
             candidate_ranges = [*base_offpeak_ranges, *combined_dispatches]
 
-        if not candidate_ranges:
-            return None
-
-        offpeak_ranges = merge_and_sort_time_ranges(candidate_ranges)
-
-        for offpeak_range in offpeak_ranges:
-            startUtc = offpeak_range["start"]
-            endUtc = offpeak_range["end"]
-            if startUtc <= utcnow <= endUtc or utcnow <= startUtc:
-                return offpeak_range
-        return None
+        return merge_and_sort_time_ranges(candidate_ranges)
 
     def current_intelligent_charge_start_utc(
         self,
         device_id: str | None = None,
     ):
         utcnow = dt_util.utcnow()
-        next_start: datetime | None = None
 
-        for state in (self.data or {}).get('plannedDispatches', []):
-            if state.get('meta', {}).get('source') != 'smart-charge':
-                continue
-            if device_id and state.get('meta', {}).get('deviceId') != device_id:
-                continue
-
-            start_utc = self._parse_dispatch_datetime(state.get('startDtUtc'))
-            end_utc = self._parse_dispatch_datetime(state.get('endDtUtc'))
-            if not start_utc or not end_utc:
-                continue
-
-            if start_utc <= utcnow <= end_utc:
-                return start_utc
-
-            if start_utc > utcnow:
-                if not next_start or start_utc < next_start:
-                    next_start = start_utc
+        if device_id:
+            windows = self._get_smart_charge_windows(device_id)
+        else:
+            windows = sorted(
+                window
+                for window_device_id in self.get_supported_device_ids()
+                for window in self._get_smart_charge_windows(window_device_id)
+            )
 
+        # Windows are sorted by start and never end before they begin, so the
+        # first one not yet over either contains now or is the earliest upcoming.
+        next_start = next(
+            (start_utc for start_utc, end_utc in windows if utcnow <= end_utc),
+            None,
+        )
         if next_start:
             return next_start
 
@@ -582,44 +736,101 @@ class OctopusIntelligentSystem(DataUpdateCoordinator):
         device_id: str | None = None,
     ):
         utcnow = dt_util.utcnow() + timedelta(minutes=minutes_offset)
-        dispatches = (self.data or {}).get('plannedDispatches', [])
+        starts, ends = self._get_dispatch_index(source, device_id or None)
+        index = bisect_right(starts, utcnow) - 1
+        return index >= 0 and utcnow <= ends[index]
+
+    def _get_dispatch_index(
+        self, source: str | None, device_id: str | None
+    ) -> tuple[list[datetime], list[datetime]]:
+        """Return merged planned dispatch windows as parallel start/end lists.
+
+        Overlapping windows are merged, so the last start at or before a time
+        is the only window that can contain it. Built on first use per poll.
+        """
+        key = (source, device_id)
+        index = self._dispatch_index.get(key)
+        if index is not None:
+            return index
+
+        data = self.data or {}
         if device_id:
-            dispatches = [
-                state
-                for state in dispatches
-                if state.get('meta', {}).get('deviceId') == device_id
-            ]
+            # Read the device's own list rather than filtering the union.
+            device_state = data.get('devices', {}).get(device_id) or {}
+            dispatches = device_state.get('plannedDispatches', [])
+        else:
+            dispatches = data.get('plannedDispatches', [])
 
+        windows: list[tuple[datetime, datetime]] = []
         for state in dispatches:
-            if source is None or state.get('meta', {}).get('source', '') == source:
-                startUtc = self._parse_dispatch_datetime(state.get('startDtUtc'))
-                endUtc = self._parse_dispatch_datetime(state.get('endDtUtc'))
-                if not startUtc or not endUtc:
-                    continue
-                if startUtc <= utcnow <= endUtc:
-                    return True
-        return False
+            meta = state.get('meta', {})
+            if source is not None and meta.get('source', '') != source:
+                continue
+            startUtc = self._get_parsed_dispatch_time(state.get('startDtUtc'))
+            endUtc = self._get_parsed_dispatch_time(state.get('endDtUtc'))
+            if startUtc and endUtc and startUtc <= endUtc:
+                windows.append((startUtc, endUtc))
+        windows.sort()
+
+        starts: list[datetime] = []
+        ends: list[datetime] = []
+        for startUtc, endUtc in windows:
+            if ends and startUtc <= ends[-1]:
+                if endUtc > ends[-1]:
+                    ends[-1] = endUtc
+            else:
+                starts.append(startUtc)
+                ends.append(endUtc)
+
+        index = (starts, ends)
+        self._dispatch_index[key] = index
+        return index
+
+    def _get_parsed_dispatch_time(self, value):
+        """Parse a normalised dispatch timestamp, memoised until the next poll."""
+        if not isinstance(value, str):
+            return self._parse_dispatch_datetime(value)
+        try:
+            return self._parsed_dispatch_times[value]
+        except KeyError:
+            parsed = self._parse_dispatch_datetime(value)
+            self._parsed_dispatch_times[value] = parsed
+            return parsed
 
     @staticmethod
     def _parse_dispatch_datetime(value):
         if isinstance(value, datetime):
-            return value.astimezone(timezone.utc)
+            return value.astimezone(_UTC)
         if isinstance(value, str):
+            # fromisoformat reads the normalised '%Y-%m-%d %H:%M:%S%z' strings
+            # far faster than strptime; offsets stay mandatory as before.
             try:
-                return datetime.strptime(value, '%Y-%m-%d %H:%M:%S%z').astimezone(timezone.utc)
+                parsed = datetime.fromisoformat(value)
             except ValueError:
                 return None
+            if parsed.tzinfo is None:
+                return None
+            return parsed.astimezone(_UTC)
         return None
 
     def is_off_peak_time_now(self, minutes_offset: int = 0):
-        now = dt_util.now() + timedelta(minutes=minutes_offset)
-        offpeak_start_mins = self._off_peak_start.seconds // 60
-        offpeak_end_mins = self._off_peak_end.seconds // 60
+        # Entities ask many times within the same minute; the answer only
+        # depends on the minute being checked and the local time zone.
+        utcnow = dt_util.utcnow()
+        local_tz = dt_util.DEFAULT_TIME_ZONE
+        minute = int(utcnow.timestamp()) // 60 + minutes_offset
+        cached = self._off_peak_time_cache
+        if cached is not None and cached[0] == minute and cached[1] is local_tz:
+            return cached[2]
+
+        now = (utcnow + timedelta(minutes=minutes_offset)).astimezone(local_tz)
         now_mins = now.hour * 60 + now.minute
-        if (offpeak_end_mins < offpeak_start_mins):
-            return now_mins >= offpeak_start_mins or now_mins <= offpeak_end_mins
+        if self._off_peak_wraps:
+            result = now_mins >= self._off_peak_start_min or now_mins <= self._off_peak_end_min
         else:
-            return offpeak_start_mins <= now_mins <= offpeak_end_mins
+            result = self._off_peak_start_min <= now_mins <= self._off_peak_end_min
+        self._off_peak_time_cache = (minute, local_tz, result)
+        return result
 
     def is_off_peak_now(self, minutes_offset: int = 0):
         return self.is_off_peak_time_now(minutes_offset) or self.is_charging_now('smart-charge', minutes_offset)
@@ -666,6 +877,40 @@ class OctopusIntelligentSystem(DataUpdateCoordinator):
             )
         return self.is_off_peak_time_now(minutes_offset)
 
+    def is_slot_mode_active_ahead(
+        self,
+        slot_mode: str,
+        *,
+        device_id: str | None,
+        look_ahead_mins: int = 0,
+    ) -> bool:
+        """Return True when the slot mode is active at every half hour up to look_ahead_mins.
+
+        The look-ahead windows of one mode and device are prefixes of each
+        other, so their checks are shared. Dispatch and tariff boundaries fall
+        on whole seconds, so results hold for the rest of the current second.
+        """
+        second = int(dt_util.utcnow().timestamp())
+        key = (slot_mode, device_id)
+        cached = self._slot_mode_runs.get(key)
+        if cached is None or cached[0] != second:
+            cached = (second, [])
+            self._slot_mode_runs[key] = cached
+
+        # Results are all True except possibly the last, where checking stops.
+        results = cached[1]
+        needed = look_ahead_mins // 30 + 1
+        is_active = self.is_slot_mode_active
+        while len(results) < needed and (not results or results[-1]):
+            results.append(
+                is_active(
+                    slot_mode,
+                    device_id=device_id,
+                    minutes_offset=len(results) * 30,
+                )
+            )
+        return len(results) >= needed and results[needed - 1]
+
     def get_target_soc(self, device_id: str | None = None):
         device_state = self._get_device_state(device_id)
         if not device_state:
@@ -684,24 +929,27 @@ class OctopusIntelligentSystem(DataUpdateCoordinator):
 
     def get_ready_time_summary(self, device_id: str | None = None) -> TargetReadySummary:
         target_key = self.get_active_target_key()
+        cache_key = (self._data_version, device_id, target_key)
+        summary = self._summary_cache.get(cache_key)
+        if summary is None:
+            summary = self._build_ready_time_summary(device_id, target_key)
+            self._summary_cache[cache_key] = summary
+        return summary
+
+    def _build_ready_time_summary(
+        self, device_id: str | None, target_key: str
+    ) -> TargetReadySummary:
         mode = 'weekend' if target_key == 'weekendTargetTime' else 'weekday'
-        device_ids = self.get_supported_device_ids()
-        if device_id:
-            device_ids = [device_id]
+        device_ids = (device_id,) if device_id else self.get_supported_device_ids()
 
         device_targets: list[DeviceTargetSchedule] = []
         for current_device_id in device_ids:
             state = self.get_device_state(current_device_id) or {}
             preferences = (state.get('preferences') or {})
-            device = state.get('device') or {}
-            label = format_equipment_name(
-                device,
-                fallback=f"Equipment {current_device_id}",
-            )
             device_targets.append(
                 DeviceTargetSchedule(
                     device_id=current_device_id,
-                    label=label,
+                    label=self.get_equipment_label(current_device_id),
                     weekday_target_time=normalize_time_string(preferences.get('weekdayTargetTime')),
                     weekend_target_time=normalize_time_string(preferences.get('weekendTargetTime')),
                     active_target_time=normalize_time_string(preferences.get(target_key)),
@@ -725,7 +973,7 @@ class OctopusIntelligentSystem(DataUpdateCoordinator):
             active_target_time=(active_entry.active_target_time if active_entry else None),
             target_device_id=(active_entry.device_id if active_entry else None),
             target_device_label=(active_entry.label if active_entry else None),
-            device_targets=device_targets,
+            device_targets=tuple(device_targets),
         )
 
     async def async_set_target_soc(self, target_soc: int, device_id: str | None = None):
@@ -740,7 +988,7 @@ class OctopusIntelligentSystem(DataUpdateCoordinator):
             target_soc,
             device_id=device_id or self.get_primary_equipment_id(),
         )
-        await self.async_refresh()
+        await self._async_apply_charge_preferences(device_id, target_time, target_soc)
 
     async def async_set_target_time(self, target_time: str, device_id: str | None = None):
         target_soc = self.get_target_soc(device_id)
@@ -754,7 +1002,46 @@ class OctopusIntelligentSystem(DataUpdateCoordinator):
             target_soc,
             device_id=device_id or self.get_primary_equipment_id(),
         )
-        await self.async_refresh()
+        await self._async_apply_charge_preferences(device_id, target_time, target_soc)
+
+    async def _async_apply_charge_preferences(
+        self, device_id: str | None, target_time: float, target_soc: int
+    ):
+        """Push preferences the API just accepted to listeners, then refresh.
+
+        The client writes one schedule for every day of the week, rounded to
+        5 % and half hours, so both weekday and weekend values are replaced.
+        The coordinator data is copied rather than mutated because entities
+        cache lookups against its identity.
+
+        The local update only covers preferences. Octopus recalculates planned
+        dispatches after a change, so a (debounced) refresh follows to bring
+        the dispatch-driven entities up to date as well.
+        """
+        device_id = device_id or self.get_primary_equipment_id()
+        data = self.data or {}
+        devices = data.get("devices") or {}
+        device_state = devices.get(device_id)
+        if device_state is None:
+            return
+
+        target_time, target_soc = round_charge_preferences(target_time, target_soc)
+        target_time_str = to_time_string(timedelta(hours=target_time))
+        preferences = {
+            **(device_state.get("preferences") or {}),
+            "weekdayTargetSoc": target_soc,
+            "weekendTargetSoc": target_soc,
+            "weekdayTargetTime": target_time_str,
+            "weekendTargetTime": target_time_str,
+        }
+        devices = {**devices, device_id: {**device_state, "preferences": preferences}}
+        updated = {**data, "devices": devices}
+        if data.get("primary_equipment_id") == device_id:
+            updated["vehicleChargingPreferences"] = preferences
+
+        self._reset_poll_caches(devices)
+        self.async_set_updated_data(updated)
+        await self.async_request_refresh()
 
     async def async_start_boost_charge(self, device_id: str | None = None):
         target_device = device_id or self.get_primary_equipment_id()
@@ -62,6 +62,8 @@ class PersistentDataStore:
             minor_version=1,
         )
         self._stop_event_listener: CALLBACK_TYPE | None = None
+        # Snapshot of what is known to be on disk, so unchanged data is not rewritten.
+        self._saved_data: dict[str, Any] | None = None
         self.lazy_save = lazy_save
 
     @property
@@ -93,11 +95,16 @@ class PersistentDataStore:
             _LOGGER.error(ex)
         if isinstance(data, dict):
             self.data.set_values(data)
+            self._saved_data = asdict(self.data)
 
     async def save(self, raise_on_error=False):
-        """Save the data to persistent storage."""
+        """Save the data to persistent storage, unless it is unchanged since the last load/save."""
+        data = asdict(self.data)
+        if data == self._saved_data:
+            return
         try:
-            await self._store.async_save(asdict(self.data))
+            await self._store.async_save(data)
+            self._saved_data = data
         except Exception as ex:  # pylint: disable=broad-exception-caught
             msg = f"Error saving persistent data: {ex}"
             if raise_on_error:
@@ -108,6 +115,7 @@ class PersistentDataStore:
         """Remove the data from persistent storage (delete the JSON file on disk)."""
         if disable_lazy_save:
             self.lazy_save = False
+        self._saved_data = None
         try:
             await self._store.async_remove()
         except Exception as ex:  # pylint: disable=broad-exception-caught
@@ -1,12 +1,9 @@
-from typing import Any
-
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util import slugify
 
 from .const import (
     DOMAIN,
@@ -21,6 +18,17 @@ import logging
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared by every device's entities; an entity only takes its own copy if the
+# API reports a value outside the standard options.
+_SOC_OPTIONS: tuple[str, ...] = tuple(f"{value}" for value in INTELLIGENT_SOC_OPTIONS)
+_CHARGE_TIME_OPTIONS: tuple[str, ...] = tuple(INTELLIGENT_CHARGE_TIMES)
+# Reuses the option strings themselves, so refreshes allocate nothing new.
+_SOC_OPTION_LABELS: dict[int, str] = dict(zip(INTELLIGENT_SOC_OPTIONS, _SOC_OPTIONS))
+_SOC_OPTION_VALUES: dict[str, int] = {
+    **{f"{value}": value for value in INTELLIGENT_SOC_OPTIONS},
+    **{f"{value}%": value for value in INTELLIGENT_SOC_OPTIONS},
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -30,10 +38,11 @@ async def async_setup_entry(
     octopus_system = hass.data[DOMAIN][config_entry.entry_id][OCTOPUS_SYSTEM]
     device_ids = octopus_system.get_supported_device_ids()
 
-    entities: list[SelectEntity] = []
-    for device_id in device_ids:
-        entities.append(OctopusIntelligentTargetSoc(octopus_system, device_id=device_id))
-        entities.append(OctopusIntelligentTargetTime(octopus_system, device_id=device_id))
+    entities: list[SelectEntity] = [
+        entity_class(octopus_system, device_id=device_id)
+        for device_id in device_ids
+        for entity_class in (OctopusIntelligentTargetSoc, OctopusIntelligentTargetTime)
+    ]
 
     if entities:
         async_add_entities(entities, False)
@@ -52,60 +61,52 @@ class OctopusIntelligentTargetSoc(
         self._octopus_system = octopus_system
         self._device_id = device_id
         base_unique_id = "octopus_intelligent_target_soc"
-        self._unique_id = f"{base_unique_id}_{slugify(device_id)}"
-        self._options = [f"{value}" for value in INTELLIGENT_SOC_OPTIONS]
+        self._attr_unique_id = f"{base_unique_id}_{octopus_system.device_slug(device_id)}"
+        self._attr_options = _SOC_OPTIONS
+        self._attr_unit_of_measurement = PERCENTAGE
+        self._attr_icon = "mdi:battery-charging-medium"
         self._current_option: str | None = None
-        self._refresh_current_option()
+        self._current_soc_value: int | None = None
 
     @property
     def name(self) -> str:
         return f"{self._equipment_label()} Target State of Charge"
 
-    @property
-    def unique_id(self) -> str:
-        return self._unique_id
-
-    @property
-    def options(self) -> list[str]:
-        return self._options
-
     @property
     def current_option(self) -> str | None:
         return self._current_option
 
     @property
     def available(self) -> bool:
-        if not super().available:
-            return False
-        return bool(self._equipment_state())
+        return self.coordinator.last_update_success and bool(self._equipment_state())
 
     @property
     def device_info(self):
         return self._device_info()
 
-    @property
-    def unit_of_measurement(self) -> str:
-        return PERCENTAGE
-
-    @property
-    def icon(self) -> str:
-        return "mdi:battery-charging-medium"
+    @callback
+    def _async_refresh_on_add(self) -> None:
+        self._refresh_current_option()
 
     @callback
-    def _handle_coordinator_update(self) -> None:
+    def _async_update_from_coordinator(self) -> None:
         previous = self._current_option
         self._refresh_current_option()
         if self._current_option != previous:
             self.async_write_ha_state()
 
     async def async_select_option(self, option: str) -> None:
-        try:
-            selected_target = int(option.replace("%", ""))
-        except ValueError:
-            _LOGGER.warning("Invalid target SOC option %s", option)
-            return
+        selected_target = _SOC_OPTION_VALUES.get(option)
+        if selected_target is None:
+            # Only values reported by the API fall outside the standard options.
+            try:
+                selected_target = int(option.replace("%", ""))
+            except ValueError:
+                _LOGGER.warning("Invalid target SOC option %s", option)
+                return
         await self._octopus_system.async_set_target_soc(selected_target, self._device_id)
         self._current_option = option
+        self._current_soc_value = selected_target
         self.async_write_ha_state()
 
     def _refresh_current_option(self) -> None:
@@ -114,7 +115,7 @@ class OctopusIntelligentTargetSoc(
         target_soc: int | None = None
 
         if device_entry:
-            if summary.mode == "weekend":
+            if summary.is_weekend:
                 target_soc = (
                     device_entry.weekend_target_soc
                     if device_entry.weekend_target_soc is not None
@@ -132,10 +133,14 @@ class OctopusIntelligentTargetSoc(
             preferences = (state.get("preferences") or {})
             target_soc = preferences.get("weekdayTargetSoc") or preferences.get("weekendTargetSoc")
 
+        if target_soc == self._current_soc_value:
+            return
+
+        self._current_soc_value = target_soc
         if target_soc is not None:
-            option_value = f"{target_soc}"
-            if option_value not in self._options:
-                self._options.append(option_value)
+            option_value = _SOC_OPTION_LABELS.get(target_soc) or f"{target_soc}"
+            if option_value not in self._attr_options:
+                self._attr_options = (*self._attr_options, option_value)
             self._current_option = option_value
         else:
             self._current_option = None
@@ -154,43 +159,33 @@ class OctopusIntelligentTargetTime(
         self._octopus_system = octopus_system
         self._device_id = device_id
         base_unique_id = "octopus_intelligent_target_time"
-        self._unique_id = f"{base_unique_id}_{slugify(device_id)}"
-        self._options = list(INTELLIGENT_CHARGE_TIMES)
+        self._attr_unique_id = f"{base_unique_id}_{octopus_system.device_slug(device_id)}"
+        self._attr_options = _CHARGE_TIME_OPTIONS
+        self._attr_icon = "mdi:clock-time-seven-outline"
         self._current_option: str | None = None
-        self._refresh_current_option()
 
     @property
     def name(self) -> str:
         return f"{self._equipment_label()} Target Ready By Time"
 
-    @property
-    def unique_id(self) -> str:
-        return self._unique_id
-
-    @property
-    def options(self) -> list[str]:
-        return self._options
-
     @property
     def current_option(self) -> str | None:
         return self._current_option
 
     @property
     def available(self) -> bool:
-        if not super().available:
-            return False
-        return bool(self._equipment_state())
+        return self.coordinator.last_update_success and bool(self._equipment_state())
 
     @property
     def device_info(self):
         return self._device_info()
 
-    @property
-    def icon(self) -> str:
-        return "mdi:clock-time-seven-outline"
+    @callback
+    def _async_refresh_on_add(self) -> None:
+        self._refresh_current_option()
 
     @callback
-    def _handle_coordinator_update(self) -> None:
+    def _async_update_from_coordinator(self) -> None:
         previous = self._current_option
         self._refresh_current_option()
         if self._current_option != previous:
@@ -208,7 +203,7 @@ class OctopusIntelligentTargetTime(
         if not target_time:
             device_entry = summary.first_target()
             if device_entry:
-                if summary.mode == "weekend":
+                if summary.is_weekend:
                     target_time = (
                         device_entry.weekend_target_time
                         or device_entry.weekday_target_time
@@ -230,8 +225,8 @@ class OctopusIntelligentTargetTime(
                 or preferences.get("weekendTargetTime")
             )
 
-        if target_time and target_time not in self._options:
-            self._options.append(target_time)
+        if target_time and target_time not in self._attr_options:
+            self._attr_options = (*self._attr_options, target_time)
 
         self._current_option = target_time
 
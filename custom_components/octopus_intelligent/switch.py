@@ -1,11 +1,8 @@
-from typing import Any
-
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util import slugify
 
 from .const import DOMAIN, OCTOPUS_SYSTEM
 from .entity import OctopusIntelligentPerDeviceEntityMixin
@@ -21,16 +18,14 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ):
     octopus_system = hass.data[DOMAIN][config_entry.entry_id][OCTOPUS_SYSTEM]
-    devices = octopus_system.get_supported_device_ids()
-
-    entities: list[SwitchEntity] = []
-    for device_id in devices:
-        entities.append(
-            OctopusIntelligentSmartChargeSwitch(octopus_system, device_id=device_id)
-        )
-        entities.append(
-            OctopusIntelligentBumpChargeSwitch(octopus_system, device_id=device_id)
+    entities: list[SwitchEntity] = [
+        entity_class(octopus_system, device_id=device_id)
+        for device_id in octopus_system.get_supported_device_ids()
+        for entity_class in (
+            OctopusIntelligentSmartChargeSwitch,
+            OctopusIntelligentBumpChargeSwitch,
         )
+    ]
 
     if entities:
         async_add_entities(entities, False)
@@ -44,23 +39,25 @@ class OctopusIntelligentBumpChargeSwitch(
         self._octopus_system = octopus_system
         self._device_id = device_id
         base_unique_id = "octopus_intelligent_bump_charge"
-        self._unique_id = f"{base_unique_id}_{slugify(device_id)}"
+        self._unique_id = f"{base_unique_id}_{octopus_system.device_slug(device_id)}"
         self._is_on = octopus_system.is_boost_charging_now(device_id)
+        self._available = self._compute_available()
 
     @callback
-    def _handle_coordinator_update(self) -> None:
+    def _async_update_from_coordinator(self) -> None:
         self._is_on = self._octopus_system.is_boost_charging_now(self._device_id)
-        self.async_write_ha_state()
+        self._available = self._compute_available()
+        self._async_write_ha_state_if_changed(self._is_on)
 
     async def async_turn_on(self, **kwargs):
         await self._octopus_system.async_start_boost_charge(self._device_id)
         self._is_on = True
-        self.async_write_ha_state()
+        self._async_write_ha_state_if_changed(self._is_on)
 
     async def async_turn_off(self, **kwargs):
         await self._octopus_system.async_cancel_boost_charge(self._device_id)
         self._is_on = False
-        self.async_write_ha_state()
+        self._async_write_ha_state_if_changed(self._is_on)
 
     @property
     def is_on(self):
@@ -76,9 +73,10 @@ class OctopusIntelligentBumpChargeSwitch(
 
     @property
     def available(self) -> bool:
-        if not super().available:
-            return False
-        return bool(self._equipment_state())
+        return self._available
+
+    def _compute_available(self) -> bool:
+        return self.coordinator.last_update_success and bool(self._equipment_state())
 
     @property
     def device_info(self):
@@ -102,8 +100,9 @@ class OctopusIntelligentSmartChargeSwitch(
         self._octopus_system = octopus_system
         self._device_id = device_id
         base_unique_id = "octopus_intelligent_smart_charging"
-        self._unique_id = f"{base_unique_id}_{slugify(device_id)}"
+        self._unique_id = f"{base_unique_id}_{octopus_system.device_slug(device_id)}"
         self._is_on = octopus_system.is_smart_charging_enabled(device_id)
+        self._available = self._compute_available()
 
     @property
     def name(self):
@@ -115,9 +114,10 @@ class OctopusIntelligentSmartChargeSwitch(
 
     @property
     def available(self) -> bool:
-        if not super().available:
-            return False
-        return bool(self._equipment_state())
+        return self._available
+
+    def _compute_available(self) -> bool:
+        return self.coordinator.last_update_success and bool(self._equipment_state())
 
     @property
     def is_on(self):
@@ -132,17 +132,18 @@ class OctopusIntelligentSmartChargeSwitch(
         return "mdi:flash-auto"
 
     @callback
-    def _handle_coordinator_update(self) -> None:
+    def _async_update_from_coordinator(self) -> None:
         self._is_on = self._octopus_system.is_smart_charging_enabled(self._device_id)
-        self.async_write_ha_state()
+        self._available = self._compute_available()
+        self._async_write_ha_state_if_changed(self._is_on)
 
     async def async_turn_on(self, **kwargs):
         await self._octopus_system.async_resume_smart_charging(self._device_id)
         self._is_on = True
-        self.async_write_ha_state()
+        self._async_write_ha_state_if_changed(self._is_on)
 
     async def async_turn_off(self, **kwargs):
         await self._octopus_system.async_suspend_smart_charging(self._device_id)
         self._is_on = False
-        self.async_write_ha_state()
+        self._async_write_ha_state_if_changed(self._is_on)
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from datetime import timedelta
+from functools import lru_cache
+import math
 from typing import Any, Mapping
 
 from .const import (
@@ -11,6 +13,9 @@ from .const import (
 )
 
 
+# The helpers below see the same few tariff and target times over and over, and
+# their results are immutable, so they are memoised.
+@lru_cache(maxsize=256)
 def to_timedelta(str_time: str) -> timedelta:
     """Convert a time string to a timedelta."""
     parts = str_time.split(":")
@@ -24,18 +29,30 @@ def to_timedelta(str_time: str) -> timedelta:
 
     return timedelta(hours=int(hours), minutes=int(minutes), seconds=int(seconds))
 
+@lru_cache(maxsize=256)
 def to_time_string(td: timedelta) -> str:
     """Convert a timedelta to a HH:mm time string."""
     return f"{td.seconds // 3600:02}:{td.seconds // 60 % 60:02}"
 
+@lru_cache(maxsize=256)
 def to_hours_after_midnight(str_time: str) -> float:
     td = to_timedelta(str_time)
     return td.seconds / 3600
 
+def round_charge_preferences(
+    ready_by_hours: float, target_soc: float
+) -> tuple[float, int]:
+    """Round a ready-by time and target SOC to the half hours and 5 % steps the API stores."""
+    return 0.5 * round(ready_by_hours / 0.5), 5 * math.ceil(round(target_soc) / 5)
+
 def normalize_time_string(value: str | None) -> str | None:
     """Return HH:MM even if API provides HH:MM:SS."""
     if not isinstance(value, str):
         return None
+    return _normalize_time_str(value)
+
+@lru_cache(maxsize=256)
+def _normalize_time_str(value: str) -> str | None:
     trimmed = value.strip()
     if not trimmed:
         return None
@@ -49,17 +66,42 @@ def merge_and_sort_time_ranges(date_ranges: list) -> list:
     if not date_ranges:
         return []
 
-    sorted_ranges = sorted(date_ranges, key=lambda r: r["start"])
-    merged_date_ranges = [sorted_ranges[0]]
+    # Sort and merge plain (start, end) tuples; dicts are only built for the result.
+    pairs = sorted((r["start"], r["end"]) for r in date_ranges)
+    merged: list[tuple[Any, Any]] = [pairs[0]]
 
-    for next_range in sorted_ranges[1:]:
-        current = merged_date_ranges[-1]
-        if current["end"] >= next_range["start"]:
-            current["end"] = max(current["end"], next_range["end"])
+    for start, end in pairs[1:]:
+        current_start, current_end = merged[-1]
+        if current_end >= start:
+            if end > current_end:
+                merged[-1] = (current_start, end)
         else:
-            merged_date_ranges.append(next_range)
+            merged.append((start, end))
+
+    return [{"start": start, "end": end} for start, end in merged]
+
 
-    return merged_date_ranges
+def _stripped(value: Any) -> str | None:
+    """Return the stripped string, or None unless value is a non-blank string."""
+    if not isinstance(value, str):
+        return None
+    return value.strip() or None
+
+
+def _looks_like_identifier(raw_value: str | None) -> bool:
+    value = _stripped(raw_value)
+    if not value:
+        return False
+    has_lower = any(ch.islower() for ch in value)
+    has_identifier_chars = any(ch.isdigit() or ch in {"_", "-"} for ch in value)
+    return not has_lower and has_identifier_chars
+
+
+def _add_name_part(parts: dict[str, str], raw_value: str | None) -> None:
+    """Add raw_value to parts unless an equivalent part is already there."""
+    trimmed = _stripped(raw_value)
+    if trimmed:
+        parts.setdefault(" ".join(trimmed.upper().split()), trimmed)
 
 
 def format_equipment_name(device: Mapping[str, Any] | None, fallback: str | None = None) -> str:
@@ -67,70 +109,50 @@ def format_equipment_name(device: Mapping[str, Any] | None, fallback: str | None
     if not isinstance(device, Mapping):
         device = {}
 
-    parts: list[str] = []
-    seen: set[str] = set()
-
-    def _add_part(raw_value: str | None) -> None:
-        if not isinstance(raw_value, str):
-            return
-        trimmed = raw_value.strip()
-        if not trimmed:
-            return
-        normalized = " ".join(trimmed.upper().split())
-        if normalized in seen:
-            return
-        seen.add(normalized)
-        parts.append(trimmed)
-
-    def _looks_like_identifier(raw_value: str | None) -> bool:
-        if not isinstance(raw_value, str):
-            return False
-        value = raw_value.strip()
-        if not value:
-            return False
-        has_lower = any(ch.islower() for ch in value)
-        has_identifier_chars = any(ch.isdigit() or ch in {"_", "-"} for ch in value)
-        return not has_lower and has_identifier_chars
-
-    label_value = device.get("label")
-    label_is_identifier = _looks_like_identifier(label_value)
-    if isinstance(label_value, str) and label_value.strip() and not label_is_identifier:
-        return label_value.strip()
-
-    if label_value and not label_is_identifier:
-        _add_part(label_value)
+    label = _stripped(device.get("label"))
+    if label and not _looks_like_identifier(label):
+        return label
+
+    # Any label left is identifier-like and only used as a last resort.
+    # Parts map normalised text to the first spelling seen, in insertion order.
+    parts: dict[str, str] = {}
 
     make = device.get("make") or device.get("vehicleMake") or device.get("chargePointMake")
     model = device.get("model") or device.get("vehicleModel") or device.get("chargePointModel")
-    name = " ".join(part for part in [make, model] if isinstance(part, str) and part.strip())
-    _add_part(name if name else None)
+    name = " ".join(part for part in [make, model] if _stripped(part))
+    _add_name_part(parts, name if name else None)
 
     provider_value = device.get("provider")
     if not _looks_like_identifier(provider_value):
-        _add_part(provider_value)
+        _add_name_part(parts, provider_value)
 
     if parts:
-        return " - ".join(parts)
+        return " - ".join(parts.values())
 
-    if label_value and isinstance(label_value, str) and label_value.strip():
-        return label_value.strip()
+    if label:
+        return label
 
-    fallback_value = fallback or device.get("id")
-    if isinstance(fallback_value, str) and fallback_value.strip():
-        return fallback_value.strip()
+    fallback_value = _stripped(fallback or device.get("id"))
+    if fallback_value:
+        return fallback_value
 
     return "Octopus Intelligent Equipment"
 
+# Deletes every ASCII character that is not alphanumeric.
+_NON_ALNUM_ASCII = dict.fromkeys(
+    code for code in range(128) if not chr(code).isalnum()
+)
+
+
 def _normalize_identifier(value: str | None) -> str:
     if not isinstance(value, str):
         return ""
     uppercase = value.upper()
-    normalized = [
-        ch
-        for ch in uppercase
-        if ch.isalnum()
-    ]
-    return "".join(normalized)
+    if uppercase.isalnum():
+        return uppercase
+    if uppercase.isascii():
+        return uppercase.translate(_NON_ALNUM_ASCII)
+    return "".join(ch for ch in uppercase if ch.isalnum())
 
 
 def is_supported_equipment(device: Mapping[str, Any] | None) -> bool:
@@ -150,11 +172,11 @@ def is_supported_equipment(device: Mapping[str, Any] | None) -> bool:
     if device_identifier and device_identifier in UNSUPPORTED_DEVICE_IDENTIFIERS:
         return False
 
-    device_type = device.get("deviceType")
-    if not isinstance(device_type, str) or not device_type.strip():
+    device_type = _stripped(device.get("deviceType"))
+    if not device_type:
         return False
 
-    normalized = device_type.strip().upper()
+    normalized = device_type.upper()
     if normalized not in ALLOWED_DEVICE_TYPES:
         return False
 
@@ -10,13 +10,19 @@ matches the live API responses.
 from __future__ import annotations
 
 import asyncio
-import importlib.util
+import importlib
 import json
 import os
 import pathlib
 import sys
+import types
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 
 def _env(name: str, prompt: str) -> str:
     value = os.environ.get(name)
@@ -30,17 +36,29 @@ def _env(name: str, prompt: str) -> str:
 
 
 def _fmt_json(payload: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(
+            payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+        ).decode()
     return json.dumps(payload, indent=2, sort_keys=True)
 
 
 def _load_graphql_client_class():
     root = pathlib.Path(__file__).parent
-    client_path = root / "custom_components" / "octopus_intelligent" / "graphql_client.py"
-    spec = importlib.util.spec_from_file_location("octo_graphql_client", client_path)
-    if spec is None or spec.loader is None:
-        raise RuntimeError(f"Unable to load graphql_client module from {client_path}")
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)  # type: ignore[assignment]
+    package_path = root / "custom_components" / "octopus_intelligent"
+    # Import the client inside its package so its relative imports resolve,
+    # without running the package __init__, which needs Home Assistant.
+    for name, path in (
+        ("custom_components", package_path.parent),
+        ("custom_components.octopus_intelligent", package_path),
+    ):
+        if name not in sys.modules:
+            package = types.ModuleType(name)
+            package.__path__ = [str(path)]
+            sys.modules[name] = package
+    module = importlib.import_module(
+        "custom_components.octopus_intelligent.graphql_client"
+    )
     return module.OctopusEnergyGraphQLClient
 
 
@@ -59,21 +77,24 @@ async def main() -> None:
 
     print(f"Found {len(devices)} device(s)\n")
 
-    for idx, device in enumerate(devices, start=1):
-        device_id = device.get("id", "<unknown>")
+    # One session runs every device's queries concurrently; separate client
+    # calls would each try to open the shared transport at the same time.
+    device_ids = [device.get("id", "<unknown>") for device in devices]
+    details = await client.async_get_device_details(account_id, device_ids)
+
+    for idx, (device, device_id) in enumerate(zip(devices, device_ids), start=1):
+        prefs, dispatch_data = details.get(device_id, (None, None))
         label = device.get("label") or device_id
         print(f"=== Device {idx}: {label} ({device_id}) ===")
         print(_fmt_json(device))
 
         print("\n-- Charging Preferences --")
-        prefs = await client.async_get_device_preferences(account_id, device_id)
         if prefs:
             print(_fmt_json(prefs))
         else:
             print("<none>")
 
         print("\n-- Dispatch Summary --")
-        dispatch_data = await client.async_get_device_dispatches(account_id, device_id)
         if not dispatch_data:
             print("<none>")
             print()
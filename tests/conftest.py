@@ -0,0 +1,27 @@
+"""Shared test setup: make custom_components importable and build a coordinator."""
+import sys
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from custom_components.octopus_intelligent.octopus_intelligent_system import (  # noqa: E402
+    OctopusIntelligentSystem,
+)
+
+
+@pytest.fixture
+def system():
+    """A coordinator with a mocked hass and a 23:30-05:30 off-peak window."""
+    return OctopusIntelligentSystem(
+        MagicMock(),
+        api_key="key",
+        account_id="A-123",
+        off_peak_start=timedelta(hours=23, minutes=30),
+        off_peak_end=timedelta(hours=5, minutes=30),
+    )
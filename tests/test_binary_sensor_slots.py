@@ -5,50 +5,62 @@ import pytest
 from custom_components.octopus_intelligent.binary_sensor import (
     SLOT_MODE_OFFPEAK,
     SLOT_MODE_SMART_CHARGE,
-    _is_slot_mode_active,
     _filter_future_dispatches,
 )
 
 
-class DummySystem:
-    def __init__(self, *, smart_charge=False, offpeak=False, device_offpeak=False):
-        self.smart_charge = smart_charge
-        self.offpeak = offpeak
-        self.device_offpeak = device_offpeak
-        self.calls: list[tuple] = []
+def _stub_slot_checks(
+    system, monkeypatch, *, smart_charge=False, offpeak=False, device_offpeak=False
+):
+    calls: list[tuple] = []
 
-    def is_off_peak_charging_now(self, *, minutes_offset: int = 0, device_id: str | None = None):
-        self.calls.append(("charging", minutes_offset, device_id))
-        return self.smart_charge
+    def is_off_peak_charging_now(*, minutes_offset: int = 0, device_id: str | None = None):
+        calls.append(("charging", minutes_offset, device_id))
+        return smart_charge
 
-    def is_off_peak_time_now(self, minutes_offset: int = 0):
-        self.calls.append(("offpeak", minutes_offset))
-        return self.offpeak
+    def is_off_peak_time_now(minutes_offset: int = 0):
+        calls.append(("offpeak", minutes_offset))
+        return offpeak
 
-    def is_device_off_peak_window_now(self, device_id: str | None, minutes_offset: int = 0):
-        self.calls.append(("device_offpeak", minutes_offset, device_id))
-        return self.device_offpeak
+    def is_device_off_peak_window_now(device_id: str | None, minutes_offset: int = 0):
+        calls.append(("device_offpeak", minutes_offset, device_id))
+        return device_offpeak
 
+    monkeypatch.setattr(system, "is_off_peak_charging_now", is_off_peak_charging_now)
+    monkeypatch.setattr(system, "is_off_peak_time_now", is_off_peak_time_now)
+    monkeypatch.setattr(
+        system, "is_device_off_peak_window_now", is_device_off_peak_window_now
+    )
+    return calls
 
-def test_smart_charge_mode_uses_dispatch_calls():
-    system = DummySystem(smart_charge=True)
 
-    assert _is_slot_mode_active(system, SLOT_MODE_SMART_CHARGE, "vehicle-1", 30)
-    assert system.calls == [("charging", 30, "vehicle-1")]
+def test_smart_charge_mode_uses_dispatch_calls(system, monkeypatch):
+    calls = _stub_slot_checks(system, monkeypatch, smart_charge=True)
 
+    assert system.is_slot_mode_active_ahead(
+        SLOT_MODE_SMART_CHARGE, device_id="vehicle-1", look_ahead_mins=30
+    )
+    assert calls == [("charging", 0, "vehicle-1"), ("charging", 30, "vehicle-1")]
 
-def test_combined_offpeak_uses_tariff_window():
-    system = DummySystem(offpeak=True)
 
-    assert _is_slot_mode_active(system, SLOT_MODE_OFFPEAK, None, 0)
-    assert system.calls == [("offpeak", 0)]
+def test_combined_offpeak_uses_tariff_window(system, monkeypatch):
+    calls = _stub_slot_checks(system, monkeypatch, offpeak=True)
 
+    assert system.is_slot_mode_active_ahead(SLOT_MODE_OFFPEAK, device_id=None)
+    assert calls == [("offpeak", 0)]
 
-def test_device_offpeak_respects_device_helper():
-    system = DummySystem(device_offpeak=True)
 
-    assert _is_slot_mode_active(system, SLOT_MODE_OFFPEAK, "vehicle-2", 60)
-    assert system.calls == [("device_offpeak", 60, "vehicle-2")]
+def test_device_offpeak_respects_device_helper(system, monkeypatch):
+    calls = _stub_slot_checks(system, monkeypatch, device_offpeak=True)
+
+    assert system.is_slot_mode_active_ahead(
+        SLOT_MODE_OFFPEAK, device_id="vehicle-2", look_ahead_mins=60
+    )
+    assert calls == [
+        ("device_offpeak", 0, "vehicle-2"),
+        ("device_offpeak", 30, "vehicle-2"),
+        ("device_offpeak", 60, "vehicle-2"),
+    ]
 
 
 def test_filter_future_dispatches_ignores_expired_entries():
@@ -0,0 +1,78 @@
+import asyncio
+
+from custom_components.octopus_intelligent import octopus_intelligent_system
+from custom_components.octopus_intelligent.entity import (
+    OctopusIntelligentPerDeviceEntityMixin,
+)
+
+
+class _Entity(OctopusIntelligentPerDeviceEntityMixin):
+    entity_id = "sensor.test"
+
+    def __init__(self, system, *, fail=False):
+        self._octopus_system = system
+        self._device_id = None
+        self._fail = fail
+        self.updated = False
+
+    def _async_update_from_coordinator(self) -> None:
+        if self._fail:
+            raise RuntimeError("boom")
+        self.updated = True
+
+
+def test_coordinator_update_runs_entity_hook(system):
+    entity = _Entity(system)
+
+    entity._handle_coordinator_update()
+
+    assert entity.updated
+
+
+def test_coordinator_update_logs_entity_failures(system, caplog):
+    entity = _Entity(system, fail=True)
+
+    entity._handle_coordinator_update()
+
+    assert "sensor.test" in caplog.text
+    assert "boom" in caplog.text
+
+
+class _EntityBase:
+    async def async_added_to_hass(self) -> None:
+        self.removers = []
+
+    def async_on_remove(self, func) -> None:
+        self.removers.append(func)
+
+
+class _TimedEntity(OctopusIntelligentPerDeviceEntityMixin, _EntityBase):
+    _refresh_on_half_hour = True
+
+    def __init__(self, system):
+        self._octopus_system = system
+        self._device_id = None
+        self.events = []
+
+    def _async_refresh_on_add(self) -> None:
+        self.events.append("refresh")
+
+    def timer_update(self, now) -> None:
+        self.events.append(now)
+
+
+def test_added_entity_refreshes_and_follows_the_half_hour(system, monkeypatch):
+    timers = []
+    monkeypatch.setattr(
+        octopus_intelligent_system,
+        "async_track_utc_time_change",
+        lambda hass, action, **kwargs: timers.append(action) or (lambda: None),
+    )
+    entity = _TimedEntity(system)
+
+    asyncio.run(entity.async_added_to_hass())
+    [tick] = timers
+    tick("now")
+
+    assert entity.events == ["refresh", "now"]
+    assert len(entity.removers) == 1
@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+from gql.transport.exceptions import TransportQueryError
+
+from custom_components.octopus_intelligent.graphql_client import (
+    OctopusEnergyGraphQLClient,
+)
+
+
+class FakeSession:
+    def __init__(self, combined_error=None):
+        self.combined_error = combined_error
+        self.operations: list[tuple[str, str]] = []
+
+    async def execute(self, query, variable_values=None, operation_name=None):
+        device_id = variable_values["deviceId"]
+        self.operations.append((operation_name, device_id))
+        if operation_name == "getDeviceDetails":
+            if self.combined_error is not None:
+                raise self.combined_error
+            return {"devices": [{"id": device_id}], "flexPlannedDispatches": []}
+        if operation_name == "getDevicePreferences":
+            return {"devices": [{"id": device_id}]}
+        return {"flexPlannedDispatches": []}
+
+
+def _get_device_details(client, session):
+    return asyncio.run(
+        client._OctopusEnergyGraphQLClient__async_get_device_details(
+            session, "A-123", ["dev-1", "dev-2"]
+        )
+    )
+
+
+def test_device_details_use_one_combined_query_per_device():
+    client = OctopusEnergyGraphQLClient("key")
+    session = FakeSession()
+
+    details = _get_device_details(client, session)
+
+    assert sorted(session.operations) == [
+        ("getDeviceDetails", "dev-1"),
+        ("getDeviceDetails", "dev-2"),
+    ]
+    assert details["dev-1"][0] == {"id": "dev-1"}
+    assert details["dev-2"][1]["flexPlannedDispatches"] == []
+
+
+def test_device_details_fall_back_when_combined_query_is_rejected():
+    client = OctopusEnergyGraphQLClient("key")
+    session = FakeSession(
+        TransportQueryError(
+            "rejected", errors=[{"message": "Query complexity limit exceeded"}]
+        )
+    )
+
+    details = _get_device_details(client, session)
+
+    assert ("getDevicePreferences", "dev-1") in session.operations
+    assert ("getDeviceDispatches", "dev-2") in session.operations
+    assert details["dev-2"] == ({"id": "dev-2"}, {"flexPlannedDispatches": []})
+    assert client._combined_device_query is False
+
+
+def test_device_details_keep_combined_query_after_transient_errors():
+    client = OctopusEnergyGraphQLClient("key")
+    session = FakeSession(
+        TransportQueryError(
+            "expired",
+            errors=[
+                {
+                    "message": "Signature of the JWT has expired.",
+                    "extensions": {"errorType": "APPLICATION"},
+                }
+            ],
+        )
+    )
+
+    with pytest.raises(TransportQueryError):
+        _get_device_details(client, session)
+
+    assert client._combined_device_query is True
+    assert {operation for operation, _ in session.operations} == {"getDeviceDetails"}
@@ -0,0 +1,254 @@
+import asyncio
+import copy
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import homeassistant.util.dt as dt_util
+import pytest
+
+from custom_components.octopus_intelligent import octopus_intelligent_system
+from custom_components.octopus_intelligent.octopus_intelligent_system import (
+    OctopusIntelligentSystem,
+)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2024-02-25T02:00:00+00:00",
+        "2024-06-25T02:00:00+01:00",
+        "2024-02-25T02:00:00-05:30",
+        "2024-02-25T02:00:00Z",
+    ],
+)
+def test_format_dispatch_time_fast_path_matches_full_parse(value):
+    expected = datetime.fromisoformat(value.replace("Z", "+00:00")).strftime(
+        "%Y-%m-%d %H:%M:%S%z"
+    )
+
+    assert OctopusIntelligentSystem._format_dispatch_time(value) == expected
+
+
+def test_format_dispatch_time_handles_fractional_seconds():
+    formatted = OctopusIntelligentSystem._format_dispatch_time(
+        "2024-02-25T02:00:00.123456+00:00"
+    )
+
+    assert formatted == "2024-02-25 02:00:00+0000"
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2024-02-25 02:00:00+0000",
+        "2024-06-25 02:00:00+0100",
+        "2024-02-25 02:00:00-0530",
+    ],
+)
+def test_parse_dispatch_datetime_matches_strptime(value):
+    expected = datetime.strptime(value, "%Y-%m-%d %H:%M:%S%z").astimezone(
+        timezone.utc
+    )
+
+    assert OctopusIntelligentSystem._parse_dispatch_datetime(value) == expected
+
+
+@pytest.mark.parametrize("value", ["2024-02-25 02:00:00", "not a date", None])
+def test_parse_dispatch_datetime_rejects_values_without_offset(value):
+    assert OctopusIntelligentSystem._parse_dispatch_datetime(value) is None
+
+
+def test_is_charging_now_checks_overlapping_dispatches(system, monkeypatch):
+    smart = {
+        "startDtUtc": "2024-02-25 01:00:00+0000",
+        "endDtUtc": "2024-02-25 04:00:00+0000",
+        "meta": {"deviceId": "dev-1", "source": "smart-charge"},
+    }
+    boost = {
+        "startDtUtc": "2024-02-25 02:00:00+0000",
+        "endDtUtc": "2024-02-25 02:30:00+0000",
+        "meta": {"deviceId": "dev-2", "source": "bump-charge"},
+    }
+    system.data = {
+        "devices": {
+            "dev-1": {"plannedDispatches": [smart]},
+            "dev-2": {"plannedDispatches": [boost]},
+        },
+        "plannedDispatches": [smart, boost],
+    }
+    monkeypatch.setattr(
+        dt_util, "utcnow", lambda: datetime(2024, 2, 25, 3, tzinfo=timezone.utc)
+    )
+
+    assert system.is_charging_now()
+    assert system.is_charging_now("smart-charge", device_id="dev-1")
+    assert not system.is_charging_now("bump-charge")
+    assert not system.is_charging_now(device_id="dev-2")
+
+
+def test_sort_by_start_orders_mixed_offsets_chronologically():
+    dispatches = [
+        {"startDtUtc": "2024-06-01 09:30:00+0000"},
+        {"startDtUtc": "2024-06-01 10:00:00+0100"},
+    ]
+
+    OctopusIntelligentSystem._sort_by_start(dispatches)
+
+    assert [dispatch["startDtUtc"] for dispatch in dispatches] == [
+        "2024-06-01 10:00:00+0100",
+        "2024-06-01 09:30:00+0000",
+    ]
+
+
+@pytest.mark.parametrize(
+    "other_start",
+    ["2024-06-01 09:30:00+0000", "2024-06-01 10:00:00+0100"],
+)
+def test_sort_by_start_puts_missing_starts_last(other_start):
+    dispatches = [
+        {"startDtUtc": None, "id": "missing"},
+        {"startDtUtc": "2024-06-01 09:00:00+0000", "id": "first"},
+        {"startDtUtc": other_start, "id": "second"},
+    ]
+
+    OctopusIntelligentSystem._sort_by_start(dispatches)
+
+    assert [dispatch["id"] for dispatch in dispatches] == [
+        "first",
+        "second",
+        "missing",
+    ]
+
+
+def test_sort_by_start_accepts_a_lone_missing_start():
+    dispatches = [{"startDtUtc": None}]
+
+    OctopusIntelligentSystem._sort_by_start(dispatches)
+
+    assert dispatches == [{"startDtUtc": None}]
+
+
+def test_slot_mode_look_ahead_shares_checks_between_windows(system, monkeypatch):
+    active_offsets = {0, 30, 60, 90}
+    calls = []
+
+    def is_slot_mode_active(slot_mode, *, device_id, minutes_offset=0):
+        calls.append(minutes_offset)
+        return minutes_offset in active_offsets
+
+    monkeypatch.setattr(system, "is_slot_mode_active", is_slot_mode_active)
+    monkeypatch.setattr(
+        dt_util, "utcnow", lambda: datetime(2024, 2, 25, 3, tzinfo=timezone.utc)
+    )
+
+    results = [
+        system.is_slot_mode_active_ahead(
+            "smart_charge", device_id="dev-1", look_ahead_mins=look_ahead
+        )
+        for look_ahead in (0, 60, 120, 180)
+    ]
+
+    assert results == [True, True, False, False]
+    assert calls == [0, 30, 60, 90, 120]
+
+
+def test_next_offpeak_range_follows_time_zone_changes(system, monkeypatch):
+    monkeypatch.setattr(
+        dt_util, "utcnow", lambda: datetime(2024, 2, 25, 12, tzinfo=timezone.utc)
+    )
+    monkeypatch.setattr(dt_util, "DEFAULT_TIME_ZONE", timezone.utc)
+    assert system.next_offpeak_range_utc()["start"] == datetime(
+        2024, 2, 25, 23, 30, tzinfo=timezone.utc
+    )
+
+    # Same local date, so only the zone tells the cached ranges apart.
+    monkeypatch.setattr(dt_util, "DEFAULT_TIME_ZONE", timezone(timedelta(hours=-5)))
+    assert system.next_offpeak_range_utc()["start"] == datetime(
+        2024, 2, 26, 4, 30, tzinfo=timezone.utc
+    )
+
+
+def test_half_hour_tick_keeps_going_after_a_failing_listener(
+    system, monkeypatch, caplog
+):
+    timers = []
+
+    def track_utc_time_change(hass, action, **kwargs):
+        timers.append(action)
+        return lambda: None
+
+    monkeypatch.setattr(
+        octopus_intelligent_system,
+        "async_track_utc_time_change",
+        track_utc_time_change,
+    )
+    refreshed = []
+
+    def failing(now):
+        raise RuntimeError("boom")
+
+    system.async_add_half_hour_listener(failing)
+    system.async_add_half_hour_listener(refreshed.append)
+    now = datetime(2024, 2, 25, 3, 30, 1, tzinfo=timezone.utc)
+
+    [tick] = timers
+    tick(now)
+
+    assert refreshed == [now]
+    assert "boom" in caplog.text
+
+
+def _set_target_soc(system, target_soc, device_id):
+    system.client = MagicMock(async_set_charge_preferences=AsyncMock())
+    system.async_request_refresh = AsyncMock()
+    asyncio.run(system.async_set_target_soc(target_soc, device_id=device_id))
+
+
+def _preferences_data(primary_equipment_id):
+    preferences = {
+        "weekdayTargetSoc": 80,
+        "weekendTargetSoc": 80,
+        "weekdayTargetTime": "07:00",
+        "weekendTargetTime": "07:00",
+        "minimumSoc": 20,
+    }
+    return {
+        "devices": {
+            "dev-1": {"preferences": dict(preferences)},
+            "dev-2": {"preferences": dict(preferences)},
+        },
+        "primary_equipment_id": primary_equipment_id,
+        "vehicleChargingPreferences": dict(preferences),
+    }
+
+
+def test_set_target_soc_applies_rounded_preferences_to_a_copy(system):
+    original = _preferences_data("dev-1")
+    system.data = original
+    snapshot = copy.deepcopy(original)
+
+    _set_target_soc(system, 83, "dev-1")
+
+    assert original == snapshot
+    assert system.data is not original
+    expected = {
+        "weekdayTargetSoc": 85,
+        "weekendTargetSoc": 85,
+        "weekdayTargetTime": "07:00",
+        "weekendTargetTime": "07:00",
+        "minimumSoc": 20,
+    }
+    assert system.data["devices"]["dev-1"]["preferences"] == expected
+    assert system.data["vehicleChargingPreferences"] == expected
+    assert system.data["devices"]["dev-2"] is original["devices"]["dev-2"]
+    system.client.async_set_charge_preferences.assert_awaited_once()
+    system.async_request_refresh.assert_awaited_once()
+
+
+def test_set_target_soc_leaves_primary_preferences_for_other_devices(system):
+    system.data = _preferences_data("dev-1")
+
+    _set_target_soc(system, 90, "dev-2")
+
+    assert system.data["devices"]["dev-2"]["preferences"]["weekdayTargetSoc"] == 90
+    assert system.data["vehicleChargingPreferences"]["weekdayTargetSoc"] == 80
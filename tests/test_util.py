@@ -1,38 +1,11 @@
 from datetime import timedelta
-from importlib import util as importlib_util
-from pathlib import Path
-import sys
-from types import ModuleType
-
-COMPONENT_ROOT = Path(__file__).resolve().parents[1] / "custom_components"
-PACKAGE_PATH = COMPONENT_ROOT / "octopus_intelligent"
-PACKAGE_NAME = "custom_components.octopus_intelligent"
-
-if "custom_components" not in sys.modules:
-    custom_components_pkg = ModuleType("custom_components")
-    custom_components_pkg.__path__ = [str(COMPONENT_ROOT)]
-    sys.modules["custom_components"] = custom_components_pkg
-
-if PACKAGE_NAME not in sys.modules:
-    octopus_pkg = ModuleType(PACKAGE_NAME)
-    octopus_pkg.__path__ = [str(PACKAGE_PATH)]
-    sys.modules[PACKAGE_NAME] = octopus_pkg
-
-const_spec = importlib_util.spec_from_file_location(
-    f"{PACKAGE_NAME}.const", PACKAGE_PATH / "const.py"
-)
-const_module = importlib_util.module_from_spec(const_spec)
-const_spec.loader.exec_module(const_module)  # type: ignore[attr-defined]
-sys.modules[f"{PACKAGE_NAME}.const"] = const_module
 
-util_spec = importlib_util.spec_from_file_location(
-    f"{PACKAGE_NAME}.util", PACKAGE_PATH / "util.py"
+from custom_components.octopus_intelligent.util import (
+    merge_and_sort_time_ranges,
+    round_charge_preferences,
+    to_hours_after_midnight,
+    to_timedelta,
 )
-util_module = importlib_util.module_from_spec(util_spec)
-util_spec.loader.exec_module(util_module)  # type: ignore[attr-defined]
-
-to_timedelta = util_module.to_timedelta
-to_hours_after_midnight = util_module.to_hours_after_midnight
 
 
 def test_to_timedelta_accepts_seconds():
@@ -45,3 +18,23 @@ def test_to_hours_after_midnight_handles_seconds():
     hours = to_hours_after_midnight("06:30:00")
 
     assert hours == 6.5
+
+
+def test_merge_and_sort_time_ranges_leaves_inputs_untouched():
+    ranges = [
+        {"start": 5, "end": 8},
+        {"start": 1, "end": 3},
+        {"start": 2, "end": 6},
+        {"start": 10, "end": 12},
+    ]
+    original = [dict(r) for r in ranges]
+
+    merged = merge_and_sort_time_ranges(ranges)
+
+    assert merged == [{"start": 1, "end": 8}, {"start": 10, "end": 12}]
+    assert ranges == original
+
+
+def test_round_charge_preferences_uses_half_hours_and_five_percent_steps():
+    assert round_charge_preferences(7.3, 83) == (7.5, 85)
+    assert round_charge_preferences(7.2, 80.4) == (7.0, 80)